@@ -3,19 +3,26 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Final
+from typing import Any, Final
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_DEVICE_ID, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady, HomeAssistantError
-from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service import async_extract_entity_ids
 
 from .api import TadoXApi, TadoXApiError, TadoXAuthError
 from .const import (
+    API_STATS_SAVE_DELAY,
     CONF_ACCESS_TOKEN,
     CONF_API_CALLS_TODAY,
     CONF_API_RESET_TIME,
@@ -55,75 +62,334 @@ ATTR_START_DATE: Final = "start_date"
 ATTR_END_DATE: Final = "end_date"
 
 SERVICE_SET_CLIMATE_TIMER: Final = "set_climate_timer"
-ATTR_ENTITY_ID: Final = "entity_id"
 ATTR_TEMPERATURE: Final = "temperature"
 ATTR_DURATION: Final = "duration"
 ATTR_TERMINATION_TYPE: Final = "termination_type"
 
+# Shared validators, built once so every schema reuses the same callables
+_OFFSET_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=-9.9, max=9.9))
+_TEMPERATURE_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=5.0, max=25.0))
+_DURATION_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=1, max=1440),  # 1 minute to 24 hours
+)
+_READING_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=0))
+_TARIFF_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0))
+_TERMINATION_TYPES = frozenset(
+    {TERMINATION_TIMER, TERMINATION_MANUAL, TERMINATION_NEXT_TIME_BLOCK}
+)
+_EIQ_UNITS = frozenset({"m3", "kWh"})
+
+# Device models registered for rooms and the home (not physical Tado devices)
+_VIRTUAL_DEVICE_MODELS = frozenset({"Tado X Room", "Tado X Home"})
+# Identifier prefix of the mobile devices registered by the device tracker
+_MOBILE_DEVICE_PREFIX = "mobile_"
+
 # Service schemas
 SERVICE_SET_TEMPERATURE_OFFSET_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_DEVICE_ID): cv.string,
-        vol.Required(ATTR_OFFSET): vol.All(
-            vol.Coerce(float),
-            vol.Range(min=-9.9, max=9.9),
-        ),
+        vol.Required(ATTR_OFFSET): _OFFSET_VALIDATOR,
     }
 )
 
 SERVICE_ADD_METER_READING_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_READING): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(ATTR_READING): _READING_VALIDATOR,
         vol.Optional(ATTR_DATE): cv.string,
     }
 )
 
 SERVICE_SET_EIQ_TARIFF_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_TARIFF): vol.All(vol.Coerce(float), vol.Range(min=0)),
-        vol.Required(ATTR_UNIT): vol.In(["m3", "kWh"]),
+        vol.Required(ATTR_TARIFF): _TARIFF_VALIDATOR,
+        vol.Required(ATTR_UNIT): vol.In(_EIQ_UNITS),
         vol.Optional(ATTR_START_DATE): cv.string,
         vol.Optional(ATTR_END_DATE): cv.string,
     }
 )
 
-SERVICE_SET_CLIMATE_TIMER_SCHEMA = vol.Schema(
+# Entity service schema: accepts entity_id (single or list) plus device/area targets
+SERVICE_SET_CLIMATE_TIMER_SCHEMA = cv.make_entity_service_schema(
     {
-        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
-        vol.Required(ATTR_TEMPERATURE): vol.All(
-            vol.Coerce(float),
-            vol.Range(min=5.0, max=25.0),
-        ),
-        vol.Required(ATTR_DURATION): vol.All(
-            vol.Coerce(int),
-            vol.Range(min=1, max=1440),  # 1 minute to 24 hours
-        ),
+        vol.Required(ATTR_TEMPERATURE): _TEMPERATURE_VALIDATOR,
+        vol.Required(ATTR_DURATION): _DURATION_VALIDATOR,
         vol.Optional(ATTR_TERMINATION_TYPE, default=TERMINATION_TIMER): vol.In(
-            [TERMINATION_TIMER, TERMINATION_MANUAL, TERMINATION_NEXT_TIME_BLOCK]
+            _TERMINATION_TYPES
         ),
     }
 )
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Tado X from a config entry."""
-    session = async_get_clientsession(hass)
+def _safe_fromiso(value: Any) -> datetime | None:
+    """Parse a persisted ISO timestamp, returning None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _extract_room_id(unique_id: str) -> int:
+    """Extract the room ID from a Tado X climate entity unique_id.
+
+    The unique_id is "{home_id}_{room_id}_climate", or "{home_id}_{room_id}"
+    for entities created by older versions.
+    """
+    parts = unique_id.rsplit("_", 2)
+    if parts[-1] == "climate" and len(parts) == 3:
+        return int(parts[-2])
+    if len(parts) == 2:
+        return int(parts[-1])
+    raise ValueError(f"Unexpected unique_id format: {unique_id}")
+
+
+@callback
+def _async_update_entry_data(
+    hass: HomeAssistant, entry: ConfigEntry, updates: dict[str, Any]
+) -> bool:
+    """Merge updates into the config entry data, skipping unchanged writes.
+
+    Returns True if the entry was updated.
+    """
+    if all(entry.data.get(key) == value for key, value in updates.items()):
+        return False
+    hass.config_entries.async_update_entry(entry, data={**entry.data, **updates})
+    return True
+
+
+def _first_coordinator(hass: HomeAssistant) -> TadoXDataUpdateCoordinator:
+    """Return the coordinator of the first loaded Tado X home."""
+    coordinators: dict[str, TadoXDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if not coordinators:
+        raise HomeAssistantError("No Tado X home is loaded")
+    return next(iter(coordinators.values()))
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services, shared by all config entries.
+
+    The handlers look up the coordinator of a loaded entry on every call,
+    so they keep working after the entry that registered them is reloaded
+    or removed.
+    """
+    if hass.services.has_service(DOMAIN, SERVICE_SET_CLIMATE_TIMER):
+        return
+
+    async def async_set_temperature_offset(call: ServiceCall) -> None:
+        """Handle set_temperature_offset service call."""
+        device_id = call.data[ATTR_DEVICE_ID]
+        offset = call.data[ATTR_OFFSET]
+
+        # Get device registry
+        device_registry_instance = dr.async_get(hass)
+        device = device_registry_instance.async_get(device_id)
+
+        if not device:
+            _LOGGER.error("Device %s not found", device_id)
+            return
+
+        # Find the device serial number from identifiers
+        # Identifier format is (DOMAIN, serial_number) or (DOMAIN, home_id_room_id)
+        device_serial = next(
+            (identifier[1] for identifier in device.identifiers if identifier[0] == DOMAIN),
+            None,
+        )
+
+        if not device_serial:
+            _LOGGER.error("Could not find serial number for device %s", device_id)
+            return
+
+        # Room, home and mobile devices are not Tado hardware and have no
+        # temperature offset
+        if device.model in _VIRTUAL_DEVICE_MODELS or device_serial.startswith(
+            _MOBILE_DEVICE_PREFIX
+        ):
+            _LOGGER.error(
+                "Cannot set temperature offset for device %s. "
+                "Please select a specific valve or sensor device.",
+                device_id,
+            )
+            return
+
+        # Use the coordinator of the home the device belongs to
+        coordinator = next(
+            (
+                coordinator
+                for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+                if entry_id in device.config_entries
+            ),
+            None,
+        )
+        if coordinator is None:
+            _LOGGER.error("Device %s does not belong to a loaded Tado X home", device_id)
+            return
 
-    # Parse token expiry
-    token_expiry = None
-    if entry.data.get(CONF_TOKEN_EXPIRY):
         try:
-            token_expiry = datetime.fromisoformat(entry.data[CONF_TOKEN_EXPIRY])
-        except (ValueError, TypeError):
-            pass
+            await coordinator.api.set_temperature_offset(device_serial, offset)
+            await coordinator.async_request_refresh()
+            _LOGGER.info(
+                "Set temperature offset for device %s to %.1f°C",
+                device_serial,
+                offset,
+            )
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to set temperature offset for device %s: %s",
+                device_serial,
+                err,
+            )
+
+    async def async_add_meter_reading(call: ServiceCall) -> None:
+        """Handle add_meter_reading service call."""
+        reading = call.data[ATTR_READING]
+        date = call.data.get(ATTR_DATE)
+        coordinator = _first_coordinator(hass)
+
+        try:
+            await coordinator.api.add_meter_reading(reading, date)
+            _LOGGER.info("Meter reading %s added successfully", reading)
+        except TadoXApiError as err:
+            _LOGGER.error("Failed to add meter reading: %s", err)
+            raise HomeAssistantError(f"Failed to add meter reading: {err}") from err
+
+    async def async_set_eiq_tariff(call: ServiceCall) -> None:
+        """Handle set_eiq_tariff service call."""
+        tariff = call.data[ATTR_TARIFF]
+        unit = call.data[ATTR_UNIT]
+        start_date = call.data.get(ATTR_START_DATE)
+        end_date = call.data.get(ATTR_END_DATE)
+        coordinator = _first_coordinator(hass)
 
-    # Parse API reset time for persistence
-    api_reset_time = None
-    if entry.data.get(CONF_API_RESET_TIME):
         try:
-            api_reset_time = datetime.fromisoformat(entry.data[CONF_API_RESET_TIME])
-        except (ValueError, TypeError):
-            pass
+            await coordinator.api.set_eiq_tariff(tariff, unit, start_date, end_date)
+            _LOGGER.info("EIQ tariff %.2f %s set successfully", tariff, unit)
+        except TadoXApiError as err:
+            _LOGGER.error("Failed to set EIQ tariff: %s", err)
+            raise HomeAssistantError(f"Failed to set EIQ tariff: {err}") from err
+
+    async def async_set_climate_timer(call: ServiceCall) -> None:
+        """Handle set_climate_timer service call."""
+        temperature = call.data[ATTR_TEMPERATURE]
+        duration_minutes = call.data[ATTR_DURATION]
+        termination_type = call.data.get(ATTR_TERMINATION_TYPE, TERMINATION_TIMER)
+
+        # Resolve the targeted entities (entity, device or area) through HA
+        entity_ids = await async_extract_entity_ids(hass, call)
+
+        # Get the entities from registry
+        entity_registry = er.async_get(hass)
+        coordinators: dict[str, TadoXDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+
+        # Convert minutes to seconds
+        duration_seconds = duration_minutes * 60
+
+        # Config entry ID -> {entity_id: room_id}, so each home uses its own API
+        targets: dict[str, dict[str, int]] = {}
+        for entity_id in entity_ids:
+            # Device and area targets also pull in the room's sensors and
+            # entities of other integrations; only Tado X climate entities apply
+            if not entity_id.startswith("climate."):
+                continue
+            entity_entry = entity_registry.async_get(entity_id)
+            if (
+                not entity_entry
+                or entity_entry.platform != DOMAIN
+                or not entity_entry.unique_id
+            ):
+                _LOGGER.debug("Skipping %s: not a Tado X climate entity", entity_id)
+                continue
+
+            coordinator = coordinators.get(entity_entry.config_entry_id)
+            if coordinator is None:
+                raise HomeAssistantError(
+                    f"Entity {entity_id} does not belong to a loaded Tado X home"
+                )
+
+            # Unique IDs never change, so the parsed room_id is cached
+            room_id = coordinator.room_id_for_unique_id.get(entity_entry.unique_id)
+            if room_id is None:
+                try:
+                    room_id = _extract_room_id(entity_entry.unique_id)
+                except ValueError as err:
+                    raise HomeAssistantError(
+                        f"Could not extract room_id from entity {entity_id}: {err}"
+                    ) from err
+                coordinator.room_id_for_unique_id[entity_entry.unique_id] = room_id
+
+            targets.setdefault(entity_entry.config_entry_id, {})[entity_id] = room_id
+
+        if not targets:
+            raise HomeAssistantError("No Tado X climate entity specified")
+
+        failure: BaseException | None = None
+        for entry_id, home_targets in targets.items():
+            coordinator = coordinators[entry_id]
+
+            # The rooms are independent, so set them all concurrently
+            results = await coordinator.api.set_rooms_temperature(
+                [(room_id, temperature) for room_id in home_targets.values()],
+                power="ON",
+                termination_type=termination_type,
+                duration_seconds=duration_seconds,
+            )
+
+            for entity_id, result in zip(home_targets, results):
+                if result is None:
+                    _LOGGER.info(
+                        "Set %s to %.1f°C for %d minutes",
+                        entity_id,
+                        temperature,
+                        duration_minutes,
+                    )
+                elif isinstance(result, TadoXApiError):
+                    _LOGGER.error(
+                        "Failed to set climate timer for %s: %s", entity_id, result
+                    )
+                    failure = failure or result
+                else:
+                    raise result
+
+            await coordinator.async_request_refresh()
+
+        if failure is not None:
+            raise HomeAssistantError(f"Failed to set climate timer: {failure}") from failure
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TEMPERATURE_OFFSET,
+        async_set_temperature_offset,
+        schema=SERVICE_SET_TEMPERATURE_OFFSET_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ADD_METER_READING,
+        async_add_meter_reading,
+        schema=SERVICE_ADD_METER_READING_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_EIQ_TARIFF,
+        async_set_eiq_tariff,
+        schema=SERVICE_SET_EIQ_TARIFF_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CLIMATE_TIMER,
+        async_set_climate_timer,
+        schema=SERVICE_SET_CLIMATE_TIMER_SCHEMA,
+    )
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Tado X from a config entry."""
+    session = async_get_clientsession(hass)
+
+    # Parse token expiry and API reset time for persistence
+    token_expiry = _safe_fromiso(entry.data.get(CONF_TOKEN_EXPIRY))
+    api_reset_time = _safe_fromiso(entry.data.get(CONF_API_RESET_TIME))
 
     # Create a mutable container for the API reference (needed for callback closure)
     api_container: dict[str, TadoXApi] = {}
@@ -133,16 +399,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if "api" not in api_container:
             return
         api = api_container["api"]
-        hass.config_entries.async_update_entry(
+        if _async_update_entry_data(
+            hass,
             entry,
-            data={
-                **entry.data,
+            {
                 CONF_ACCESS_TOKEN: api.access_token,
                 CONF_REFRESH_TOKEN: api.refresh_token,
                 CONF_TOKEN_EXPIRY: api.token_expiry.isoformat() if api.token_expiry else None,
             },
-        )
-        _LOGGER.debug("Tokens persisted to config entry")
+        ):
+            _LOGGER.debug("Tokens persisted to config entry")
 
     api = TadoXApi(
         session=session,
@@ -163,14 +429,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     try:
         await api.refresh_access_token()
 
-        # Update stored tokens and API call stats
-        hass.config_entries.async_update_entry(
+        # Update stored API call stats (tokens were already saved by save_tokens)
+        _async_update_entry_data(
+            hass,
             entry,
-            data={
-                **entry.data,
-                CONF_ACCESS_TOKEN: api.access_token,
-                CONF_REFRESH_TOKEN: api.refresh_token,
-                CONF_TOKEN_EXPIRY: api.token_expiry.isoformat() if api.token_expiry else None,
+            {
                 CONF_API_CALLS_TODAY: api.api_calls_today,
                 CONF_API_RESET_TIME: api.api_reset_time.isoformat(),
                 CONF_HAS_AUTO_ASSIST: api.has_auto_assist,
@@ -181,17 +444,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
 
     # Create callback to save API stats periodically
-    def save_api_stats() -> None:
-        """Save API call statistics to config entry."""
-        hass.config_entries.async_update_entry(
+    # Writes are debounced: the counter changes on every update, so persist
+    # at most once per API_STATS_SAVE_DELAY and flush on unload
+    pending_stats_save: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def write_api_stats(_now: datetime | None = None) -> None:
+        """Write API call statistics to config entry."""
+        pending_stats_save.pop("cancel", None)
+        _async_update_entry_data(
+            hass,
             entry,
-            data={
-                **entry.data,
+            {
                 CONF_API_CALLS_TODAY: api.api_calls_today,
                 CONF_API_RESET_TIME: api.api_reset_time.isoformat(),
             },
         )
 
+    def save_api_stats() -> None:
+        """Schedule saving API call statistics to config entry."""
+        if "cancel" not in pending_stats_save:
+            pending_stats_save["cancel"] = async_call_later(
+                hass, API_STATS_SAVE_DELAY, write_api_stats
+            )
+
+    @callback
+    def flush_api_stats() -> None:
+        """Write pending API call statistics immediately."""
+        if cancel := pending_stats_save.pop("cancel", None):
+            cancel()
+            write_api_stats()
+
+    entry.async_on_unload(flush_api_stats)
+
     # Get configured scan interval (or None to use auto-detection based on tier)
     configured_scan_interval = entry.data.get(CONF_SCAN_INTERVAL)
 
@@ -229,181 +514,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Register services
-    async def async_set_temperature_offset(call: ServiceCall) -> None:
-        """Handle set_temperature_offset service call."""
-        device_id = call.data[ATTR_DEVICE_ID]
-        offset = call.data[ATTR_OFFSET]
-
-        # Get device registry
-        device_registry_instance = dr.async_get(hass)
-        device = device_registry_instance.async_get(device_id)
-
-        if not device:
-            _LOGGER.error("Device %s not found", device_id)
-            return
-
-        # Find the device serial number from identifiers
-        device_serial = None
-        for identifier in device.identifiers:
-            if identifier[0] == DOMAIN:
-                # Identifier format is (DOMAIN, serial_number) or (DOMAIN, home_id_room_id)
-                device_serial = identifier[1]
-                break
-
-        if not device_serial:
-            _LOGGER.error("Could not find serial number for device %s", device_id)
-            return
-
-        # Check if this is a room device (format: home_id_room_id) or a real device
-        if "_" in device_serial:
-            _LOGGER.error(
-                "Cannot set temperature offset for room device %s. "
-                "Please select a specific valve or sensor device.",
-                device_id,
-            )
-            return
-
-        try:
-            await coordinator.api.set_temperature_offset(device_serial, offset)
-            await coordinator.async_request_refresh()
-            _LOGGER.info(
-                "Set temperature offset for device %s to %.1f°C",
-                device_serial,
-                offset,
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to set temperature offset for device %s: %s",
-                device_serial,
-                err,
-            )
-
-    # Register temperature offset service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_TEMPERATURE_OFFSET):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_TEMPERATURE_OFFSET,
-            async_set_temperature_offset,
-            schema=SERVICE_SET_TEMPERATURE_OFFSET_SCHEMA,
-        )
-
-    async def async_add_meter_reading(call: ServiceCall) -> None:
-        """Handle add_meter_reading service call."""
-        reading = call.data[ATTR_READING]
-        date = call.data.get(ATTR_DATE)
-
-        try:
-            await coordinator.api.add_meter_reading(reading, date)
-            _LOGGER.info("Meter reading %s added successfully", reading)
-        except TadoXApiError as err:
-            _LOGGER.error("Failed to add meter reading: %s", err)
-            raise HomeAssistantError(f"Failed to add meter reading: {err}") from err
-
-    # Register meter reading service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_ADD_METER_READING):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_ADD_METER_READING,
-            async_add_meter_reading,
-            schema=SERVICE_ADD_METER_READING_SCHEMA,
-        )
-
-    async def async_set_eiq_tariff(call: ServiceCall) -> None:
-        """Handle set_eiq_tariff service call."""
-        tariff = call.data[ATTR_TARIFF]
-        unit = call.data[ATTR_UNIT]
-        start_date = call.data.get(ATTR_START_DATE)
-        end_date = call.data.get(ATTR_END_DATE)
-
-        try:
-            await coordinator.api.set_eiq_tariff(tariff, unit, start_date, end_date)
-            _LOGGER.info("EIQ tariff %.2f %s set successfully", tariff, unit)
-        except TadoXApiError as err:
-            _LOGGER.error("Failed to set EIQ tariff: %s", err)
-            raise HomeAssistantError(f"Failed to set EIQ tariff: {err}") from err
-
-    # Register EIQ tariff service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_EIQ_TARIFF):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_EIQ_TARIFF,
-            async_set_eiq_tariff,
-            schema=SERVICE_SET_EIQ_TARIFF_SCHEMA,
-        )
-
-    async def async_set_climate_timer(call: ServiceCall) -> None:
-        """Handle set_climate_timer service call."""
-        entity_id = call.data[ATTR_ENTITY_ID]
-        temperature = call.data[ATTR_TEMPERATURE]
-        duration_minutes = call.data[ATTR_DURATION]
-        termination_type = call.data.get(ATTR_TERMINATION_TYPE, TERMINATION_TIMER)
-
-        # Get the entity from registry
-        from homeassistant.helpers import entity_registry as er
-        entity_registry = er.async_get(hass)
-        entity_entry = entity_registry.async_get(entity_id)
-
-        if not entity_entry:
-            raise HomeAssistantError(f"Entity {entity_id} not found in registry")
-
-        # Verify this is a Tado X entity
-        if entity_entry.platform != DOMAIN:
-            raise HomeAssistantError(
-                f"Entity {entity_id} is not a Tado X entity (platform: {entity_entry.platform}). "
-                f"The set_climate_timer service only works with native Tado X climate entities."
-            )
-
-        if not entity_entry.unique_id:
-            raise HomeAssistantError(f"Entity {entity_id} has no unique_id")
-
-        # Extract room_id from unique_id
-        # The unique_id for Tado X climate entities is "{home_id}_{room_id}_climate"
-        try:
-            parts = entity_entry.unique_id.split("_")
-            if len(parts) == 3 and parts[2] == "climate":
-                # Format: "12345_67_climate" where 12345 is home_id and 67 is room_id
-                room_id = int(parts[1])
-            elif len(parts) == 2:
-                # Legacy format: "12345_67" (backward compatibility)
-                room_id = int(parts[1])
-            else:
-                raise ValueError(f"Unexpected unique_id format: {entity_entry.unique_id}")
-        except (ValueError, IndexError) as err:
-            raise HomeAssistantError(
-                f"Could not extract room_id from entity {entity_id}: {err}"
-            ) from err
-
-        # Convert minutes to seconds
-        duration_seconds = duration_minutes * 60
-
-        try:
-            await coordinator.api.set_room_temperature(
-                room_id=room_id,
-                temperature=temperature,
-                power="ON",
-                termination_type=termination_type,
-                duration_seconds=duration_seconds,
-            )
-            await coordinator.async_request_refresh()
-            _LOGGER.info(
-                "Set %s to %.1f°C for %d minutes",
-                entity_id,
-                temperature,
-                duration_minutes,
-            )
-        except TadoXApiError as err:
-            _LOGGER.error("Failed to set climate timer: %s", err)
-            raise HomeAssistantError(f"Failed to set climate timer: {err}") from err
-
-    # Register climate timer service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_CLIMATE_TIMER):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_CLIMATE_TIMER,
-            async_set_climate_timer,
-            schema=SERVICE_SET_CLIMATE_TIMER_SCHEMA,
-        )
+    # Register services (shared by all entries, only once per hass instance)
+    _async_register_services(hass)
 
     # Create the "Home" device before loading platforms to ensure via_device references work
     # This prevents deprecation warnings about via_device referencing non-existing devices
@@ -3,13 +3,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import ssl
+import time
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any
 
 import aiohttp
-import ssl
+import orjson
 
 from .const import (
+    API_MAX_CONCURRENT_REQUESTS,
+    API_OPTIONAL_ENDPOINT_TIMEOUT,
+    API_RATE_LIMIT_DEFAULT_HOLD,
+    API_THROTTLE_MAX_SLEEP,
     TADO_AUTH_URL,
     TADO_CLIENT_ID,
     TADO_EIQ_API_URL,
@@ -17,10 +26,46 @@ from .const import (
     TADO_MINDER_API_URL,
     TADO_MY_API_URL,
     TADO_TOKEN_URL,
+    TOKEN_REFRESH_JITTER,
+    TOKEN_REFRESH_MARGIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fixed request bodies, serialized once at import
+_PRESENCE_HOME_BODY = orjson.dumps({"homePresence": "HOME"})
+_PRESENCE_AWAY_BODY = orjson.dumps({"homePresence": "AWAY"})
+_CHILD_LOCK_BODIES = {
+    enabled: orjson.dumps({"childLockEnabled": enabled}) for enabled in (True, False)
+}
+_AUTO_ADAPTATION_BODIES = {
+    enabled: orjson.dumps({"autoAdaptation": {"enabled": enabled}})
+    for enabled in (True, False)
+}
+
+
+def _extract_int(header: str, key: str) -> int | None:
+    """Extract the integer following key (e.g. "q=") in a rate limit header."""
+    start = header.find(key)
+    if start < 0:
+        return None
+    start += len(key)
+    end = start
+    while end < len(header) and header[end] in "0123456789":
+        end += 1
+    return int(header[start:end]) if end > start else None
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode a JSON response body with orjson (None for an empty body)."""
+    return orjson.loads(raw) if raw else None
+
+
+async def _with_timeout(call: Callable[[], Awaitable[Any]], seconds: float) -> Any:
+    """Await call(), raising TimeoutError if it takes longer than seconds."""
+    async with asyncio.timeout(seconds):
+        return await call()
+
 
 class TadoXAuthError(Exception):
     """Exception for authentication errors."""
@@ -42,6 +87,34 @@ class TadoXRateLimitError(TadoXApiError):
 class TadoXApi:
     """Tado X API client."""
 
+    # One long-lived instance per config entry; slots avoid the per-instance
+    # __dict__ on every attribute access from _request
+    __slots__ = (
+        "_access_token",
+        "_api_call_reset_time",
+        "_api_call_reset_ts",
+        "_api_calls_today",
+        "_api_quota_limit",
+        "_api_quota_remaining",
+        "_api_quota_window",
+        "_auth_headers",
+        "_has_auto_assist",
+        "_home_id",
+        "_next_allowed_mono",
+        "_on_token_refresh",
+        "_refresh_at_mono",
+        "_refresh_inflight",
+        "_refresh_margin",
+        "_refresh_token",
+        "_request_semaphore",
+        "_session",
+        "_token_expiry",
+        "_url_eiq",
+        "_url_hops",
+        "_url_minder",
+        "_url_my",
+    )
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -55,12 +128,31 @@ class TadoXApi:
     ) -> None:
         """Initialize the API client."""
         self._session = session
-        self._access_token = access_token
+        self._access_token: str | None = None
+        self._auth_headers: dict[str, str] = {}
+        self._set_access_token(access_token)
         self._refresh_token = refresh_token
-        self._token_expiry = token_expiry
+        # Pre-expiry refresh margin, jittered once per instance so the
+        # refresh schedule is stable but differs between clients
+        self._refresh_margin = TOKEN_REFRESH_MARGIN + random.uniform(
+            -TOKEN_REFRESH_JITTER, TOKEN_REFRESH_JITTER
+        )
+        self._token_expiry: datetime | None = None
+        self._refresh_at_mono: float | None = None
+        self._set_token_expiry(token_expiry)
         self._home_id: int | None = None
+        # Per-home base URLs, built once when home_id is set
+        self._url_hops = ""
+        self._url_my = ""
+        self._url_eiq = ""
+        self._url_minder = ""
         self._has_auto_assist = has_auto_assist
         self._on_token_refresh = on_token_refresh
+        # Shared future for an in-flight token refresh so concurrent callers
+        # wait for a single POST instead of racing each other
+        self._refresh_inflight: asyncio.Future[bool] | None = None
+        # Limits parallel requests when fetching several endpoints at once
+        self._request_semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
 
         # Initialize API call tracking with persistence support
         # Tado resets quotas at 12:00 UTC (noon), not midnight
@@ -70,15 +162,18 @@ class TadoXApi:
         if api_reset_time and api_reset_time > now:
             # Restore persisted values if reset time hasn't passed
             self._api_calls_today = api_calls_today
-            self._api_call_reset_time = api_reset_time
+            self._set_api_reset_time(api_reset_time)
         else:
             # Reset counter if new period or no persisted data
             self._api_calls_today = 0
-            self._api_call_reset_time = default_reset_time
+            self._set_api_reset_time(default_reset_time)
 
         # Rate limit info from API headers (will be updated on each request)
         self._api_quota_limit: int | None = None  # From ratelimit-policy header
         self._api_quota_remaining: int | None = None  # From ratelimit header
+        self._api_quota_window: int | None = None  # From ratelimit-policy header (w=)
+        # Monotonic time before which requests are held back (quota exhausted)
+        self._next_allowed_mono = 0.0
 
     @property
     def access_token(self) -> str | None:
@@ -104,6 +199,10 @@ class TadoXApi:
     def home_id(self, value: int) -> None:
         """Set the home ID."""
         self._home_id = value
+        self._url_hops = f"{TADO_HOPS_API_URL}/homes/{value}"
+        self._url_my = f"{TADO_MY_API_URL}/homes/{value}"
+        self._url_eiq = f"{TADO_EIQ_API_URL}/homes/{value}"
+        self._url_minder = f"{TADO_MINDER_API_URL}/homes/{value}"
 
     @property
     def api_calls_today(self) -> int:
@@ -135,6 +234,44 @@ class TadoXApi:
         """Return the API quota remaining from headers (if available)."""
         return self._api_quota_remaining
 
+    def _set_access_token(self, access_token: str | None) -> None:
+        """Store the access token and rebuild the request headers for it.
+
+        The headers only change when the token does, so they are built here
+        once instead of on every request.
+        """
+        self._access_token = access_token
+        self._auth_headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+
+    def _set_token_expiry(self, expiry: datetime | None) -> None:
+        """Store the token expiry and the monotonic time at which to refresh it.
+
+        The datetime is kept for persistence; the per-request check compares
+        against time.monotonic() so it is immune to wall-clock jumps.
+        """
+        if expiry is None:
+            self._token_expiry = None
+            self._refresh_at_mono = None
+            return
+        if expiry.tzinfo is None:
+            # Entries saved by older versions stored naive local time
+            expiry = expiry.astimezone(timezone.utc)
+        self._token_expiry = expiry
+        remaining = expiry.timestamp() - time.time()
+        self._refresh_at_mono = time.monotonic() + remaining - self._refresh_margin
+
+    def _set_api_reset_time(self, reset_time: datetime) -> None:
+        """Store the quota reset time and its POSIX timestamp.
+
+        The timestamp lets _request check for the rollover with a float
+        comparison against time.time() instead of building a datetime.
+        """
+        self._api_call_reset_time = reset_time
+        self._api_call_reset_ts = reset_time.timestamp()
+
     @staticmethod
     def _calculate_next_reset_time(now: datetime) -> datetime:
         """Calculate the next API quota reset time.
@@ -165,83 +302,102 @@ class TadoXApi:
         Tado returns rate limit info in these headers:
         - ratelimit-policy: "perday";q=20000;w=86400 (q=quota limit, w=window in seconds)
         - ratelimit: "perday";r=17833 (r=remaining requests)
-        """
-        import re
 
+        When the quota is exhausted, further requests are held back until the
+        window (or the daily reset, whichever comes first) has passed.
+        """
         # Parse ratelimit-policy header for quota limit
         policy_header = headers.get("ratelimit-policy", "")
         if policy_header:
             # Extract q=NUMBER from the header
-            quota_match = re.search(r"q=(\d+)", policy_header)
-            if quota_match:
-                self._api_quota_limit = int(quota_match.group(1))
+            quota = _extract_int(policy_header, "q=")
+            if quota is not None:
+                self._api_quota_limit = quota
                 # Note: We no longer auto-detect Auto-Assist based on quota headers
                 # The user's manual setting in options should be respected
                 # API header values are used for display purposes only
+            window = _extract_int(policy_header, "w=")
+            if window is not None:
+                self._api_quota_window = window
 
         # Parse ratelimit header for remaining requests
         ratelimit_header = headers.get("ratelimit", "")
         if ratelimit_header:
             # Extract r=NUMBER from the header
-            remaining_match = re.search(r"r=(\d+)", ratelimit_header)
-            if remaining_match:
-                self._api_quota_remaining = int(remaining_match.group(1))
+            remaining = _extract_int(ratelimit_header, "r=")
+            if remaining is not None:
+                self._api_quota_remaining = remaining
+                if remaining == 0 and self._api_quota_window:
+                    self._throttle_until_reset(self._api_quota_window)
+
+    def _count_api_call(self) -> None:
+        """Count one request against today's quota."""
+        # Reset counter if past reset time (noon UTC)
+        if time.time() >= self._api_call_reset_ts:
+            self._api_calls_today = 0
+            self._set_api_reset_time(
+                self._calculate_next_reset_time(datetime.now(timezone.utc))
+            )
+        self._api_calls_today += 1
+
+    def _throttle_until_reset(self, max_wait: float | None = None) -> None:
+        """Hold back requests until the quota resets (at most max_wait seconds)."""
+        wait = self._api_call_reset_ts - time.time()
+        if max_wait is not None:
+            wait = min(wait, max_wait)
+        self._next_allowed_mono = time.monotonic() + max(wait, 0.0)
 
     async def start_device_auth(self) -> dict[str, Any]:
         """Start the device authorization flow.
 
         Returns a dict with device_code, user_code, verification_uri, etc.
         """
-        _LOGGER.warning("Starting device authorization flow")
+        _LOGGER.debug("Starting device authorization flow")
+        # Per-request timeout on the shared session (pooled, keep-alive)
         timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
 
-        # Create SSL context that's more permissive for debugging
-        ssl_context = ssl.create_default_context()
-
-        # Create a dedicated session for auth to ensure timeout is respected
-        connector = aiohttp.TCPConnector(force_close=True, ssl=ssl_context)
-        async with aiohttp.ClientSession(
-            timeout=timeout,
-            connector=connector,
-        ) as auth_session:
-            try:
-                _LOGGER.warning("Sending request to %s", TADO_AUTH_URL)
-                async with auth_session.post(
-                    TADO_AUTH_URL,
-                    data={
-                        "client_id": TADO_CLIENT_ID,
-                        "scope": "offline_access",
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                ) as response:
-                    _LOGGER.warning("Device auth response status: %s", response.status)
-                    if response.status != 200:
-                        text = await response.text()
-                        _LOGGER.error("Failed to start device auth: %s - %s", response.status, text)
-                        raise TadoXAuthError(f"Failed to start device auth: {response.status}")
-                    result = await response.json()
-                    _LOGGER.warning("Device auth successful, got user_code: %s", result.get("user_code"))
-                    return result
-            except asyncio.TimeoutError as err:
-                _LOGGER.error("Timeout during device auth request (30s)")
-                raise TadoXAuthError("Timeout during device auth request") from err
-            except aiohttp.ClientError as err:
-                _LOGGER.error("Network error during device auth: %s (type: %s)", err, type(err).__name__)
-                raise TadoXAuthError(f"Network error: {err}") from err
-            except ssl.SSLError as err:
-                _LOGGER.error("SSL error during device auth: %s", err)
-                raise TadoXAuthError(f"SSL error: {err}") from err
-            except Exception as err:
-                _LOGGER.error("Unexpected error during device auth: %s (type: %s)", err, type(err).__name__)
-                raise TadoXAuthError(f"Unexpected error: {err}") from err
+        try:
+            _LOGGER.debug("Sending request to %s", TADO_AUTH_URL)
+            async with self._session.post(
+                TADO_AUTH_URL,
+                data={
+                    "client_id": TADO_CLIENT_ID,
+                    "scope": "offline_access",
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=timeout,
+            ) as response:
+                _LOGGER.debug("Device auth response status: %s", response.status)
+                if response.status != 200:
+                    text = await response.text()
+                    _LOGGER.error("Failed to start device auth: %s - %s", response.status, text)
+                    raise TadoXAuthError(f"Failed to start device auth: {response.status}")
+                result = _json_loads(await response.read()) or {}
+                _LOGGER.debug("Device auth successful, got user_code: %s", result.get("user_code"))
+                return result
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("Timeout during device auth request (30s)")
+            raise TadoXAuthError("Timeout during device auth request") from err
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Network error during device auth: %s (type: %s)", err, type(err).__name__)
+            raise TadoXAuthError(f"Network error: {err}") from err
+        except ssl.SSLError as err:
+            _LOGGER.error("SSL error during device auth: %s", err)
+            raise TadoXAuthError(f"SSL error: {err}") from err
+        except ValueError as err:
+            _LOGGER.error("Invalid device auth response: %s", err)
+            raise TadoXAuthError(f"Invalid device auth response: {err}") from err
 
     async def poll_for_token(self, device_code: str, interval: int = 5, timeout: int = 300) -> bool:
         """Poll for the access token after user authorizes.
 
         Returns True if successful, False if timed out.
         """
-        start_time = datetime.now()
-        while (datetime.now() - start_time).seconds < timeout:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # Consecutive network failures, for exponential backoff
+        fail_count = 0
+        while loop.time() < deadline:
             try:
                 async with self._session.post(
                     TADO_TOKEN_URL,
@@ -252,13 +408,16 @@ class TadoXApi:
                     },
                     headers={"Content-Type": "application/x-www-form-urlencoded"},
                 ) as response:
-                    data = await response.json()
+                    fail_count = 0
+                    data = _json_loads(await response.read()) or {}
 
                     if response.status == 200:
-                        self._access_token = data["access_token"]
+                        self._set_access_token(data["access_token"])
                         self._refresh_token = data.get("refresh_token")
                         expires_in = data.get("expires_in", 600)
-                        self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
+                        self._set_token_expiry(
+                            datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+                        )
                         return True
 
                     # Authorization pending, continue polling
@@ -270,14 +429,54 @@ class TadoXApi:
                     _LOGGER.error("Token error: %s", data)
                     raise TadoXAuthError(f"Token error: {data.get('error_description', data.get('error'))}")
 
-            except aiohttp.ClientError as err:
+            except (aiohttp.ClientError, ValueError) as err:
                 _LOGGER.error("Network error during token polling: %s", err)
-                await asyncio.sleep(interval)
+                # Exponential backoff with full jitter, capped at 60s and
+                # never sleeping past the polling deadline
+                fail_count += 1
+                delay = random.uniform(0, min(60, interval * 2**fail_count))
+                await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
 
         return False
 
     async def refresh_access_token(self) -> bool:
-        """Refresh the access token using the refresh token."""
+        """Refresh the access token using the refresh token.
+
+        Concurrent calls are coalesced: while a refresh is in flight, other
+        callers await its result instead of issuing their own request, which
+        would waste quota and could invalidate the rotated refresh token.
+        If the caller that owns the refresh is cancelled, the waiters retry
+        instead of inheriting its cancellation.
+        """
+        while (pending := self._refresh_inflight) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Re-raise unless only the owning refresh was cancelled
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+
+        inflight: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._refresh_inflight = inflight
+        try:
+            result = await self._async_refresh_access_token()
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except Exception as err:
+            inflight.set_exception(err)
+            # Mark the exception as retrieved in case nobody else is waiting
+            inflight.exception()
+            raise
+        else:
+            inflight.set_result(result)
+            return result
+        finally:
+            self._refresh_inflight = None
+
+    async def _async_refresh_access_token(self) -> bool:
+        """Perform the token refresh request."""
         if not self._refresh_token:
             raise TadoXAuthError("No refresh token available")
 
@@ -296,11 +495,13 @@ class TadoXApi:
                     _LOGGER.error("Failed to refresh token: %s - %s", response.status, text)
                     raise TadoXAuthError(f"Failed to refresh token: {response.status}")
 
-                data = await response.json()
-                self._access_token = data["access_token"]
+                data = _json_loads(await response.read()) or {}
+                self._set_access_token(data["access_token"])
                 self._refresh_token = data.get("refresh_token", self._refresh_token)
                 expires_in = data.get("expires_in", 600)
-                self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
+                self._set_token_expiry(
+                    datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+                )
 
                 # Persist tokens immediately after refresh to prevent auth loss on restart
                 if self._on_token_refresh:
@@ -311,14 +512,15 @@ class TadoXApi:
 
         except aiohttp.ClientError as err:
             raise TadoXAuthError(f"Network error during token refresh: {err}") from err
+        except (KeyError, ValueError) as err:
+            raise TadoXAuthError(f"Invalid token refresh response: {err}") from err
 
     async def _ensure_valid_token(self) -> None:
         """Ensure we have a valid access token."""
         if not self._access_token:
             raise TadoXAuthError("Not authenticated")
 
-        # Refresh if token expires in less than 60 seconds
-        if self._token_expiry and datetime.now() >= self._token_expiry - timedelta(seconds=60):
+        if self._refresh_at_mono is not None and time.monotonic() >= self._refresh_at_mono:
             await self.refresh_access_token()
 
     async def _request(
@@ -326,73 +528,77 @@ class TadoXApi:
         method: str,
         url: str,
         json_data: dict | None = None,
+        body: bytes | None = None,
     ) -> dict | list | None:
-        """Make an authenticated API request."""
-        await self._ensure_valid_token()
+        """Make an authenticated API request.
 
-        # Track API call
-        self._api_calls_today += 1
+        The payload is either json_data (serialized here) or an already
+        serialized JSON body.
+        """
+        # Don't spend a round trip (and a 429) while the quota is exhausted
+        wait = self._next_allowed_mono - time.monotonic()
+        if wait > 0:
+            if wait > API_THROTTLE_MAX_SLEEP:
+                raise TadoXRateLimitError(
+                    "API quota exhausted. Please wait for quota reset.",
+                    reset_time=self._api_call_reset_time,
+                )
+            await asyncio.sleep(wait)
 
-        # Reset counter if past reset time (noon UTC)
-        now = datetime.now(timezone.utc)
-        if now >= self._api_call_reset_time:
-            self._api_calls_today = 1
-            self._api_call_reset_time = self._calculate_next_reset_time(now)
+        await self._ensure_valid_token()
 
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        }
+        if body is None and json_data is not None:
+            body = orjson.dumps(json_data)
 
         try:
-            async with self._session.request(
-                method,
-                url,
-                headers=headers,
-                json=json_data,
-            ) as response:
-                # Parse rate limit headers from Tado API
-                self._parse_rate_limit_headers(response.headers)
-
-                if response.status == 401:
-                    # Try to refresh token and retry
-                    await self.refresh_access_token()
-                    headers["Authorization"] = f"Bearer {self._access_token}"
-                    async with self._session.request(
-                        method,
-                        url,
-                        headers=headers,
-                        json=json_data,
-                    ) as retry_response:
-                        if retry_response.status != 200:
-                            text = await retry_response.text()
-                            raise TadoXApiError(f"API error: {retry_response.status} - {text}")
-                        if retry_response.content_length == 0:
-                            return None
-                        return await retry_response.json()
-
-                if response.status == 429:
-                    # Rate limited - raise specific exception with reset time
-                    _LOGGER.warning(
-                        "Rate limit exceeded (429). Quota remaining: %s, Reset time: %s",
-                        self._api_quota_remaining,
-                        self._api_call_reset_time,
-                    )
-                    raise TadoXRateLimitError(
-                        "API rate limit exceeded (429). Please wait for quota reset.",
-                        reset_time=self._api_call_reset_time,
-                    )
-
-                if response.status not in (200, 204):
-                    text = await response.text()
-                    raise TadoXApiError(f"API error: {response.status} - {text}")
+            for attempt in range(2):
+                headers = self._auth_headers
+                async with self._session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=body,
+                ) as response:
+                    # Track API call (only requests that reached Tado count)
+                    self._count_api_call()
+                    # Parse rate limit headers from Tado API
+                    self._parse_rate_limit_headers(response.headers)
+
+                    if response.status == 401 and attempt == 0:
+                        # Try to refresh token and retry once. Skip the refresh
+                        # if another request already replaced the token we sent.
+                        if headers is self._auth_headers:
+                            await self.refresh_access_token()
+                        continue
+
+                    if response.status == 429:
+                        # Rate limited - raise specific exception with reset time.
+                        # Without a known window, don't hold until the daily reset
+                        self._throttle_until_reset(
+                            self._api_quota_window or API_RATE_LIMIT_DEFAULT_HOLD
+                        )
+                        _LOGGER.warning(
+                            "Rate limit exceeded (429). Quota remaining: %s, Reset time: %s",
+                            self._api_quota_remaining,
+                            self._api_call_reset_time,
+                        )
+                        raise TadoXRateLimitError(
+                            "API rate limit exceeded (429). Please wait for quota reset.",
+                            reset_time=self._api_call_reset_time,
+                        )
+
+                    if response.status not in (200, 204):
+                        text = await response.text()
+                        raise TadoXApiError(f"API error: {response.status} - {text}")
 
-                if response.content_length == 0 or response.status == 204:
-                    return None
-                return await response.json()
+                    if response.content_length == 0 or response.status == 204:
+                        return None
+                    return _json_loads(await response.read())
 
         except aiohttp.ClientError as err:
             raise TadoXApiError(f"Network error: {err}") from err
+        except ValueError as err:
+            raise TadoXApiError(f"Invalid JSON response: {err}") from err
 
     # My Tado API endpoints (user info)
     async def get_me(self) -> dict[str, Any]:
@@ -410,16 +616,84 @@ class TadoXApi:
         """Get all rooms with current state."""
         if not self._home_id:
             raise TadoXApiError("Home ID not set")
-        result = await self._request("GET", f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms")
+        result = await self._request("GET", f"{self._url_hops}/rooms")
         return result if isinstance(result, list) else []
 
     async def get_rooms_and_devices(self) -> dict[str, Any]:
         """Get all rooms with their devices."""
         if not self._home_id:
             raise TadoXApiError("Home ID not set")
-        result = await self._request("GET", f"{TADO_HOPS_API_URL}/homes/{self._home_id}/roomsAndDevices")
+        result = await self._request("GET", f"{self._url_hops}/roomsAndDevices")
         return result if isinstance(result, dict) else {}
 
+    async def get_state_bundle(
+        self,
+        *,
+        want_weather: bool = False,
+        want_mobile_devices: bool = False,
+        want_air_comfort: bool = False,
+        running_times_date: str | None = None,
+        want_flow_temp: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch the read-only state endpoints concurrently.
+
+        The required endpoints (rooms, roomsAndDevices, home state) are always
+        fetched; optional ones only when requested, each bounded by
+        API_OPTIONAL_ENDPOINT_TIMEOUT. Running times are fetched for
+        running_times_date when given.
+
+        Returns a dict keyed by endpoint name ("rooms", "rooms_and_devices",
+        "home_state", "weather", "mobile_devices", "air_comfort",
+        "running_times", "flow_temp"). Each value is either the endpoint
+        result or the exception it raised, so the caller decides which
+        failures are fatal.
+        """
+        calls: dict[str, Callable[[], Awaitable[Any]]] = {
+            "rooms": self.get_rooms,
+            "rooms_and_devices": self.get_rooms_and_devices,
+            "home_state": self.get_home_state,
+        }
+        optional: dict[str, Callable[[], Awaitable[Any]]] = {}
+        if want_weather:
+            optional["weather"] = self.get_weather
+        if want_mobile_devices:
+            optional["mobile_devices"] = self.get_mobile_devices
+        if want_air_comfort:
+            optional["air_comfort"] = self.get_air_comfort
+        if running_times_date:
+            optional["running_times"] = partial(
+                self.get_running_times, running_times_date, running_times_date
+            )
+        if want_flow_temp:
+            optional["flow_temp"] = self.get_flow_temperature_optimization
+        for key, call in optional.items():
+            calls[key] = partial(_with_timeout, call, API_OPTIONAL_ENDPOINT_TIMEOUT)
+
+        results = await self._gather_limited(calls.values())
+        return dict(zip(calls, results))
+
+    async def _gather_limited(
+        self, calls: Iterable[Callable[[], Awaitable[Any]]]
+    ) -> list[Any]:
+        """Run independent API calls concurrently, bounded by the semaphore.
+
+        Each call is a zero-argument callable returning the coroutine, so no
+        coroutine is created unless it will be awaited (the token check can
+        fail first). Returns one entry per call: its result, or the exception
+        it raised.
+        """
+        # Refresh the token once up front rather than from every request
+        await self._ensure_valid_token()
+
+        async def _limited(call: Callable[[], Awaitable[Any]]) -> Any:
+            async with self._request_semaphore:
+                return await call()
+
+        return await asyncio.gather(
+            *(_limited(call) for call in calls),
+            return_exceptions=True,
+        )
+
     async def set_room_temperature(
         self,
         room_id: int,
@@ -445,7 +719,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/manualControl",
+            f"{self._url_hops}/rooms/{room_id}/manualControl",
             json_data=data,
         )
 
@@ -473,7 +747,7 @@ class TadoXApi:
 
         result = await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/manualControl",
+            f"{self._url_hops}/rooms/{room_id}/manualControl",
             json_data=data,
         )
 
@@ -486,7 +760,7 @@ class TadoXApi:
 
         await self._request(
             "DELETE",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/manualControl",
+            f"{self._url_hops}/rooms/{room_id}/manualControl",
         )
 
     async def set_boost_mode(self) -> None:
@@ -500,7 +774,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/boost",
+            f"{self._url_hops}/quickActions/boost",
         )
 
     async def resume_all_schedules(self) -> None:
@@ -510,7 +784,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/resumeSchedule",
+            f"{self._url_hops}/quickActions/resumeSchedule",
         )
 
     async def set_open_window_detection(self, room_id: int, enabled: bool) -> None:
@@ -521,20 +795,63 @@ class TadoXApi:
         if enabled:
             await self._request(
                 "POST",
-                f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/openWindow",
+                f"{self._url_hops}/rooms/{room_id}/openWindow",
             )
         else:
             await self._request(
                 "DELETE",
-                f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/openWindow",
+                f"{self._url_hops}/rooms/{room_id}/openWindow",
+            )
+
+    # Multi-room writes, issued concurrently. Each returns one entry per room
+    # (None on success, or the exception raised for that room).
+    async def set_rooms_temperature(
+        self,
+        items: list[tuple[int, float]],
+        power: str = "ON",
+        termination_type: str = "TIMER",
+        duration_seconds: int = 1800,
+    ) -> list[BaseException | None]:
+        """Set the temperature for several (room_id, temperature) pairs."""
+        return await self._gather_limited(
+            partial(
+                self.set_room_temperature,
+                room_id,
+                temperature,
+                power,
+                termination_type,
+                duration_seconds,
             )
+            for room_id, temperature in items
+        )
+
+    async def set_rooms_off(
+        self,
+        room_ids: list[int],
+        termination_type: str = "TIMER",
+        duration_seconds: int = 1800,
+    ) -> list[BaseException | None]:
+        """Turn off heating for several rooms."""
+        return await self._gather_limited(
+            partial(self.set_room_off, room_id, termination_type, duration_seconds)
+            for room_id in room_ids
+        )
+
+    async def set_rooms_open_window_detection(
+        self, room_ids: list[int], enabled: bool
+    ) -> list[BaseException | None]:
+        """Enable or disable open window detection for several rooms."""
+        return await self._gather_limited(
+            partial(self.set_open_window_detection, room_id, enabled)
+            for room_id in room_ids
+        )
 
     # Presence/Geofencing endpoints (My Tado API)
     async def get_home_state(self) -> dict[str, Any]:
         """Get the current home presence state."""
         if not self._home_id:
             raise TadoXApiError("Home ID not set")
-        result = await self._request("GET", f"{TADO_MY_API_URL}/homes/{self._home_id}/state")
+        result = await self._request("GET", f"{self._url_my}/state")
         return result if isinstance(result, dict) else {}
 
     async def set_presence_home(self) -> None:
@@ -544,8 +861,8 @@ class TadoXApi:
 
         await self._request(
             "PUT",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/presenceLock",
-            json_data={"homePresence": "HOME"},
+            f"{self._url_my}/presenceLock",
+            body=_PRESENCE_HOME_BODY,
         )
 
     async def set_presence_away(self) -> None:
@@ -555,8 +872,8 @@ class TadoXApi:
 
         await self._request(
             "PUT",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/presenceLock",
-            json_data={"homePresence": "AWAY"},
+            f"{self._url_my}/presenceLock",
+            body=_PRESENCE_AWAY_BODY,
         )
 
     async def set_presence_auto(self) -> None:
@@ -566,7 +883,7 @@ class TadoXApi:
 
         await self._request(
             "DELETE",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/presenceLock",
+            f"{self._url_my}/presenceLock",
         )
 
     # Device configuration endpoints
@@ -582,7 +899,7 @@ class TadoXApi:
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/roomsAndDevices/devices/{device_serial}",
+            f"{self._url_hops}/roomsAndDevices/devices/{device_serial}",
             json_data={"temperatureOffset": offset},
         )
 
@@ -602,7 +919,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/meterReadings",
+            f"{self._url_eiq}/meterReadings",
             json_data={"date": reading_date, "reading": reading},
         )
 
@@ -618,8 +935,8 @@ class TadoXApi:
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/roomsAndDevices/devices/{device_serial}",
-            json_data={"childLockEnabled": enabled},
+            f"{self._url_hops}/roomsAndDevices/devices/{device_serial}",
+            body=_CHILD_LOCK_BODIES[bool(enabled)],
         )
 
     # Quick Actions
@@ -630,7 +947,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/boost",
+            f"{self._url_hops}/quickActions/boost",
         )
 
     async def disable_all_heating(self) -> None:
@@ -640,7 +957,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/allOff",
+            f"{self._url_hops}/quickActions/allOff",
         )
 
     async def resume_all_schedules(self) -> None:
@@ -650,7 +967,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/resumeSchedule",
+            f"{self._url_hops}/quickActions/resumeSchedule",
         )
 
     # Energy IQ Tariffs
@@ -661,7 +978,7 @@ class TadoXApi:
 
         result = await self._request(
             "GET",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/tariffs",
+            f"{self._url_eiq}/tariffs",
         )
         return result if isinstance(result, list) else []
 
@@ -697,7 +1014,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/tariffs",
+            f"{self._url_eiq}/tariffs",
             json_data=payload,
         )
 
@@ -712,7 +1029,7 @@ class TadoXApi:
 
         await self._request(
             "DELETE",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/tariffs/{tariff_id}",
+            f"{self._url_eiq}/tariffs/{tariff_id}",
         )
 
     async def get_weather(self) -> dict[str, Any]:
@@ -726,7 +1043,7 @@ class TadoXApi:
 
         result = await self._request(
             "GET",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/weather",
+            f"{self._url_my}/weather",
         )
         return result if isinstance(result, dict) else {}
 
@@ -740,7 +1057,7 @@ class TadoXApi:
             raise TadoXApiError("Home ID not set")
         result = await self._request(
             "GET",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/mobileDevices",
+            f"{self._url_my}/mobileDevices",
         )
         return result if isinstance(result, list) else []
 
@@ -754,7 +1071,7 @@ class TadoXApi:
 
         result = await self._request(
             "GET",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/airComfort",
+            f"{self._url_hops}/airComfort",
         )
         return result if isinstance(result, dict) else {}
 
@@ -793,7 +1110,7 @@ class TadoXApi:
 
         result = await self._request(
             "GET",
-            f"{TADO_MINDER_API_URL}/homes/{self._home_id}/runningTimes?from={from_date}&to={to_date}",
+            f"{self._url_minder}/runningTimes?from={from_date}&to={to_date}",
         )
         return result if isinstance(result, dict) else {}
 
@@ -822,7 +1139,7 @@ class TadoXApi:
 
         result = await self._request(
             "GET",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/settings/flowTemperatureOptimization",
+            f"{self._url_hops}/settings/flowTemperatureOptimization",
         )
         return result if isinstance(result, dict) else {}
 
@@ -837,7 +1154,7 @@ class TadoXApi:
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/settings/flowTemperatureOptimization",
+            f"{self._url_hops}/settings/flowTemperatureOptimization",
             json_data={"maxFlowTemperature": temperature},
         )
 
@@ -852,6 +1169,6 @@ class TadoXApi:
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/settings/flowTemperatureOptimization",
-            json_data={"autoAdaptation": {"enabled": enabled}},
+            f"{self._url_hops}/settings/flowTemperatureOptimization",
+            body=_AUTO_ADAPTATION_BODIES[bool(enabled)],
         )
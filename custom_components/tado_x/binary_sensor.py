@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -11,7 +12,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -21,6 +22,24 @@ from .coordinator import TadoXDataUpdateCoordinator, TadoXDevice, TadoXRoom
 
 _LOGGER = logging.getLogger(__name__)
 
+# French names for device types (used in device name)
+DEVICE_TYPE_NAMES_FR = {
+    "VA04": "Vanne",
+    "SU04": "Capteur Temp",
+    "TR04": "Récepteur",  # Wireless Receiver X
+    "RU04": "Thermostat",  # Wired Smart Thermostat X
+    "IB02": "Bridge X",
+}
+
+# English model names (used in device model field)
+DEVICE_TYPE_MODELS = {
+    "VA04": "Radiator Valve X",
+    "SU04": "Temperature Sensor X",
+    "TR04": "Wireless Receiver X",
+    "RU04": "Wired Smart Thermostat X",
+    "IB02": "Bridge X",
+}
+
 
 @dataclass(frozen=True, kw_only=True)
 class TadoXRoomBinarySensorEntityDescription(BinarySensorEntityDescription):
@@ -34,6 +53,23 @@ class TadoXDeviceBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes a Tado X device binary sensor entity."""
 
     value_fn: Callable[[TadoXDevice], bool | None]
+    # Whether the entity is created for a device at all
+    exists_fn: Callable[[TadoXDevice], bool] = lambda _: True
+
+
+def _is_heating(room: TadoXRoom) -> bool:
+    """Return True if the room is currently heating."""
+    return room.heating_power > 0
+
+
+def _is_connected(device: TadoXDevice) -> bool:
+    """Return True if the device is connected."""
+    return device.connection_state == "CONNECTED"
+
+
+def _is_battery_low(device: TadoXDevice) -> bool | None:
+    """Return True if the device battery is low (None if unknown)."""
+    return device.battery_state == "LOW" if device.battery_state else None
 
 
 ROOM_BINARY_SENSORS: tuple[TadoXRoomBinarySensorEntityDescription, ...] = (
@@ -41,19 +77,19 @@ ROOM_BINARY_SENSORS: tuple[TadoXRoomBinarySensorEntityDescription, ...] = (
         key="window_open",
         translation_key="window_open",
         device_class=BinarySensorDeviceClass.WINDOW,
-        value_fn=lambda room: room.open_window_detected,
+        value_fn=attrgetter("open_window_detected"),
     ),
     TadoXRoomBinarySensorEntityDescription(
         key="heating",
         translation_key="heating",
         device_class=BinarySensorDeviceClass.HEAT,
-        value_fn=lambda room: room.heating_power > 0,
+        value_fn=_is_heating,
     ),
     TadoXRoomBinarySensorEntityDescription(
         key="overlay_active",
         translation_key="overlay_active",
         icon="mdi:hand-back-left",
-        value_fn=lambda room: room.manual_control_active,
+        value_fn=attrgetter("manual_control_active"),
     ),
 )
 
@@ -62,13 +98,15 @@ DEVICE_BINARY_SENSORS: tuple[TadoXDeviceBinarySensorEntityDescription, ...] = (
         key="connectivity",
         translation_key="connectivity",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda device: device.connection_state == "CONNECTED",
+        value_fn=_is_connected,
     ),
     TadoXDeviceBinarySensorEntityDescription(
         key="battery_low",
         translation_key="battery_low",
         device_class=BinarySensorDeviceClass.BATTERY,
-        value_fn=lambda device: device.battery_state == "LOW" if device.battery_state else None,
+        value_fn=_is_battery_low,
+        # Skip battery low for devices without batteries
+        exists_fn=lambda device: bool(device.battery_state),
     ),
 )
 
@@ -83,22 +121,88 @@ async def async_setup_entry(
 
     entities: list[BinarySensorEntity] = []
 
-    # Add room binary sensors
-    for room_id in coordinator.data.rooms:
+    # Add room binary sensors (one shared DeviceInfo per room)
+    for room_id, room in coordinator.data.rooms.items():
+        room_device_info = _room_device_info(coordinator, room_id, room)
         for description in ROOM_BINARY_SENSORS:
-            entities.append(TadoXRoomBinarySensor(coordinator, room_id, description))
+            entities.append(
+                TadoXRoomBinarySensor(coordinator, room_id, description, room_device_info)
+            )
 
-    # Add device binary sensors
+    # Add device binary sensors (one shared DeviceInfo per device)
+    device_numbering = coordinator.build_device_numbering()
     for device in coordinator.data.devices.values():
+        device_info = _device_device_info(
+            coordinator, device, device_numbering.get(device.serial_number)
+        )
         for description in DEVICE_BINARY_SENSORS:
-            # Skip battery low for devices without batteries
-            if description.key == "battery_low" and not device.battery_state:
+            if not description.exists_fn(device):
                 continue
-            entities.append(TadoXDeviceBinarySensor(coordinator, device.serial_number, description))
+            entities.append(
+                TadoXDeviceBinarySensor(
+                    coordinator, device.serial_number, description, device_info
+                )
+            )
 
     async_add_entities(entities)
 
 
+def _room_device_info(
+    coordinator: TadoXDataUpdateCoordinator, room_id: int, room: TadoXRoom | None
+) -> DeviceInfo:
+    """Build the device info for a room."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{coordinator.home_id_str}_{room_id}")},
+        name=room.name if room else f"Room {room_id}",
+        manufacturer="Tado",
+        model="Tado X Room",
+        via_device=coordinator.home_via_device,
+    )
+
+
+def _device_device_info(
+    coordinator: TadoXDataUpdateCoordinator,
+    device: TadoXDevice,
+    device_number: tuple[int, int] | None,
+) -> DeviceInfo:
+    """Build the device info for a device.
+
+    device_number is the (ordinal, count) of the device among devices of
+    the same type in its room, from build_device_numbering().
+    """
+    serial_number = device.serial_number
+
+    # Determine via_device - link to room if device has one, otherwise to home
+    via_device_id = (
+        (DOMAIN, f"{coordinator.home_id_str}_{device.room_id}")
+        if device.room_id
+        else coordinator.home_via_device
+    )
+
+    # Generate device name with room name and numbering
+    base_name = DEVICE_TYPE_NAMES_FR.get(device.device_type, device.device_type)
+
+    if device.room_id and device.room_name:
+        if device_number and device_number[1] > 1:
+            # Multiple devices of same type - add number
+            device_name = f"{base_name} {device_number[0]} - {device.room_name}"
+        else:
+            # Only one device of this type - no number needed
+            device_name = f"{base_name} - {device.room_name}"
+    else:
+        # No room - use serial number suffix (e.g., Bridge)
+        device_name = f"{base_name} ({serial_number[-4:]})"
+
+    return DeviceInfo(
+        identifiers={(DOMAIN, serial_number)},
+        name=device_name,
+        manufacturer="Tado",
+        model=DEVICE_TYPE_MODELS.get(device.device_type, device.device_type),
+        sw_version=device.firmware_version,
+        via_device=via_device_id,
+    )
+
+
 class TadoXRoomBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], BinarySensorEntity):
     """Tado X room binary sensor entity."""
 
@@ -110,32 +214,21 @@ class TadoXRoomBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Binar
         coordinator: TadoXDataUpdateCoordinator,
         room_id: int,
         description: TadoXRoomBinarySensorEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the binary sensor entity."""
         super().__init__(coordinator)
         self._room_id = room_id
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.home_id}_{room_id}_{description.key}"
+        self._attr_unique_id = "_".join((coordinator.home_id_str, str(room_id), description.key))
+        # Device info is only read when the entity is registered
+        self._attr_device_info = device_info
 
     @property
     def _room(self) -> TadoXRoom | None:
         """Get the room data."""
         return self.coordinator.data.rooms.get(self._room_id)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        room = self._room
-        room_name = room.name if room else f"Room {self._room_id}"
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.coordinator.home_id}_{self._room_id}")},
-            name=room_name,
-            manufacturer="Tado",
-            model="Tado X Room",
-            via_device=(DOMAIN, str(self.coordinator.home_id)),
-        )
-
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
@@ -144,11 +237,6 @@ class TadoXRoomBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Binar
             return None
         return self.entity_description.value_fn(room)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
 class TadoXDeviceBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], BinarySensorEntity):
     """Tado X device binary sensor entity."""
@@ -161,6 +249,7 @@ class TadoXDeviceBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Bin
         coordinator: TadoXDataUpdateCoordinator,
         serial_number: str,
         description: TadoXDeviceBinarySensorEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the binary sensor entity."""
         super().__init__(coordinator)
@@ -168,76 +257,14 @@ class TadoXDeviceBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Bin
         self.entity_description = description
         self._attr_unique_id = f"{serial_number}_{description.key}"
         # Simple name without serial suffix - device name already has it
+        # Device info is only read when the entity is registered
+        self._attr_device_info = device_info
 
     @property
     def _device(self) -> TadoXDevice | None:
         """Get the device data."""
         return self.coordinator.data.devices.get(self._serial_number)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        device = self._device
-        if not device:
-            return DeviceInfo(
-                identifiers={(DOMAIN, self._serial_number)},
-            )
-
-        # French names for device types (used in device name)
-        device_type_names_fr = {
-            "VA04": "Vanne",
-            "SU04": "Capteur Temp",
-            "TR04": "Récepteur",  # Wireless Receiver X
-            "RU04": "Thermostat",  # Wired Smart Thermostat X
-            "IB02": "Bridge X",
-        }
-
-        # English model names (used in device model field)
-        device_type_models = {
-            "VA04": "Radiator Valve X",
-            "SU04": "Temperature Sensor X",
-            "TR04": "Wireless Receiver X",
-            "RU04": "Wired Smart Thermostat X",
-            "IB02": "Bridge X",
-        }
-
-        # Determine via_device - link to room if device has one, otherwise to home
-        via_device_id = (
-            (DOMAIN, f"{self.coordinator.home_id}_{device.room_id}")
-            if device.room_id
-            else (DOMAIN, str(self.coordinator.home_id))
-        )
-
-        # Generate device name with room name and numbering
-        base_name = device_type_names_fr.get(device.device_type, device.device_type)
-
-        if device.room_id and device.room_name:
-            # Count devices of same type in same room to determine numbering
-            same_type_in_room = sorted([
-                d.serial_number for d in self.coordinator.data.devices.values()
-                if d.room_id == device.room_id and d.device_type == device.device_type
-            ])
-
-            if len(same_type_in_room) > 1:
-                # Multiple devices of same type - add number
-                device_number = same_type_in_room.index(self._serial_number) + 1
-                device_name = f"{base_name} {device_number} - {device.room_name}"
-            else:
-                # Only one device of this type - no number needed
-                device_name = f"{base_name} - {device.room_name}"
-        else:
-            # No room - use serial number suffix (e.g., Bridge)
-            device_name = f"{base_name} ({self._serial_number[-4:]})"
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._serial_number)},
-            name=device_name,
-            manufacturer="Tado",
-            model=device_type_models.get(device.device_type, device.device_type),
-            sw_version=device.firmware_version,
-            via_device=via_device_id,
-        )
-
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
@@ -245,8 +272,3 @@ class TadoXDeviceBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Bin
         if not device:
             return None
         return self.entity_description.value_fn(device)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
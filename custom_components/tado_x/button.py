@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from collections.abc import Awaitable, Callable
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
@@ -13,7 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import TadoXDataUpdateCoordinator
+from .coordinator import TadoXDataUpdateCoordinator, TadoXRoom
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +23,30 @@ class TadoXButtonEntityDescription(ButtonEntityDescription):
     """Describes a Tado X button entity."""
 
     press_fn: Callable[[TadoXDataUpdateCoordinator], Awaitable[None]]
+    # Returns each room with the expected result of the action applied, so the
+    # new state shows right away without refetching the whole home
+    optimistic_fn: Callable[[TadoXRoom], TadoXRoom] | None = None
+
+
+def _apply_boost(room: TadoXRoom) -> TadoXRoom:
+    """Return the room marked as boosted."""
+    return replace(room, boost_mode=True, manual_control_active=True)
+
+
+def _apply_all_off(room: TadoXRoom) -> TadoXRoom:
+    """Return the room marked as turned off."""
+    return replace(room, power="OFF", boost_mode=False, manual_control_active=True)
+
+
+def _apply_resume_schedule(room: TadoXRoom) -> TadoXRoom:
+    """Return the room marked as following its schedule again."""
+    return replace(
+        room,
+        boost_mode=False,
+        manual_control_active=False,
+        manual_control_remaining_seconds=None,
+        manual_control_type=None,
+    )
 
 
 BUTTON_DESCRIPTIONS: tuple[TadoXButtonEntityDescription, ...] = (
@@ -31,18 +55,21 @@ BUTTON_DESCRIPTIONS: tuple[TadoXButtonEntityDescription, ...] = (
         translation_key="boost_all",
         icon="mdi:fire",
         press_fn=lambda coordinator: coordinator.api.boost_all_heating(),
+        optimistic_fn=_apply_boost,
     ),
     TadoXButtonEntityDescription(
         key="disable_all",
         translation_key="disable_all",
         icon="mdi:power-off",
         press_fn=lambda coordinator: coordinator.api.disable_all_heating(),
+        optimistic_fn=_apply_all_off,
     ),
     TadoXButtonEntityDescription(
         key="resume_schedules",
         translation_key="resume_schedules",
         icon="mdi:calendar-clock",
         press_fn=lambda coordinator: coordinator.api.resume_all_schedules(),
+        optimistic_fn=_apply_resume_schedule,
     ),
 )
 
@@ -92,4 +119,24 @@ class TadoXButton(CoordinatorEntity[TadoXDataUpdateCoordinator], ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         await self.entity_description.press_fn(self.coordinator)
+
+        optimistic_fn = self.entity_description.optimistic_fn
+        data = self.coordinator.data
+        if optimistic_fn is not None and data is not None:
+            # New room objects (rather than in-place edits) so entities
+            # comparing against the previous room see the change
+            self.coordinator.async_set_updated_data(
+                replace(
+                    data,
+                    rooms={
+                        room_id: optimistic_fn(room)
+                        for room_id, room in data.rooms.items()
+                    },
+                )
+            )
+
+        # Confirm the real state soon rather than at the next scheduled poll
+        # (up to 45 minutes on the free tier). The refresh debouncer delays it
+        # by REQUEST_REFRESH_COOLDOWN and merges rapid presses, so this
+        # returns right away.
         await self.coordinator.async_request_refresh()
@@ -1,7 +1,9 @@
 """Climate platform for Tado X."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import replace
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -44,11 +46,9 @@ async def async_setup_entry(
     """Set up Tado X climate entities."""
     coordinator: TadoXDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for room_id, room in coordinator.data.rooms.items():
-        entities.append(TadoXClimate(coordinator, room_id))
-
-    async_add_entities(entities)
+    async_add_entities(
+        [TadoXClimate(coordinator, room_id) for room_id in coordinator.data.rooms]
+    )
 
 
 class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity):
@@ -79,25 +79,29 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
         super().__init__(coordinator)
         self._room_id = room_id
         self._attr_unique_id = f"{coordinator.home_id}_{room_id}_climate"
-
-    @property
-    def _room(self) -> TadoXRoom | None:
-        """Get the room data."""
-        return self.coordinator.data.rooms.get(self._room_id)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        room = self._room
-        room_name = room.name if room else f"Room {self._room_id}"
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.coordinator.home_id}_{self._room_id}")},
-            name=room_name,
+        # Room data for the current coordinator update; the state properties
+        # below all read it, so it is looked up once per update
+        self._room: TadoXRoom | None = coordinator.data.rooms.get(room_id)
+        # Device info is only read when the entity is registered
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{coordinator.home_id_str}_{room_id}")},
+            name=self._room.name if self._room else f"Room {room_id}",
             manufacturer="Tado",
             model="Tado X Room",
-            via_device=(DOMAIN, str(self.coordinator.home_id)),
+            via_device=coordinator.home_via_device,
         )
+        # Latest requested (temperature, termination type, duration in minutes)
+        # not yet sent, and the lock held while a set_temperature is in flight
+        self._pending_temperature: tuple[float, str, int] | None = None
+        self._set_temperature_lock = asyncio.Lock()
+        # Everything the state is derived from, to skip writes when unchanged
+        self._last_state_source = self._state_source()
+        self._update_state_attrs()
+
+    def _state_source(self) -> tuple[TadoXRoom | None, str | None, bool]:
+        """Return the data this entity's state is built from."""
+        data = self.coordinator.data
+        return (self._room, data.presence, data.presence_locked)
 
     @property
     def available(self) -> bool:
@@ -107,36 +111,25 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
             return False
         return room.connection_state == "CONNECTED"
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        room = self._room
-        return room.current_temperature if room else None
+    def _update_state_attrs(self) -> None:
+        """Compute the state attributes from the current room data.
 
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
+        Runs once per coordinator update, before the state is written, so the
+        state properties are plain _attr_* reads.
+        """
         room = self._room
         if not room:
-            return None
-        # Only hide target temp if truly OFF (manual control with power OFF)
-        # In AUTO mode with power OFF (idle), still show the schedule target
-        if room.power == "OFF" and room.manual_control_active:
-            return None
-        return room.target_temperature
-
-    @property
-    def current_humidity(self) -> float | None:
-        """Return the current humidity."""
-        room = self._room
-        return room.humidity if room else None
+            self._attr_current_temperature = None
+            self._attr_target_temperature = None
+            self._attr_current_humidity = None
+            self._attr_hvac_mode = HVACMode.OFF
+            self._attr_hvac_action = HVACAction.OFF
+            self._attr_preset_mode = None
+            self._attr_extra_state_attributes = {}
+            return
 
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return the current HVAC mode."""
-        room = self._room
-        if not room:
-            return HVACMode.OFF
+        self._attr_current_temperature = room.current_temperature
+        self._attr_current_humidity = room.humidity
 
         _LOGGER.debug(
             "Room %s hvac_mode check - power: %s, manual_control_active: %s",
@@ -145,68 +138,51 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
             room.manual_control_active,
         )
 
-        # If manual control is active with power OFF, it's truly OFF
-        # (user explicitly turned off the heating)
+        # HVAC mode
         if room.power == "OFF" and room.manual_control_active:
-            return HVACMode.OFF
-
-        # If manual control is active with power ON, it's HEAT mode
-        if room.manual_control_active:
-            return HVACMode.HEAT
-
-        # Otherwise, it's following the schedule (AUTO)
-        # Even if power is "OFF" (idle because target temp reached),
-        # the mode is still AUTO since it's controlled by the schedule
-        return HVACMode.AUTO
+            # If manual control is active with power OFF, it's truly OFF
+            # (user explicitly turned off the heating)
+            self._attr_hvac_mode = HVACMode.OFF
+        elif room.manual_control_active:
+            # If manual control is active with power ON, it's HEAT mode
+            self._attr_hvac_mode = HVACMode.HEAT
+        else:
+            # Otherwise, it's following the schedule (AUTO)
+            # Even if power is "OFF" (idle because target temp reached),
+            # the mode is still AUTO since it's controlled by the schedule
+            self._attr_hvac_mode = HVACMode.AUTO
 
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return the current HVAC action."""
-        room = self._room
-        if not room:
-            return HVACAction.OFF
+        # Only hide target temp if truly OFF (manual control with power OFF)
+        # In AUTO mode with power OFF (idle), still show the schedule target
+        self._attr_target_temperature = (
+            None if self._attr_hvac_mode == HVACMode.OFF else room.target_temperature
+        )
 
+        # HVAC action
         if room.power == "OFF":
-            return HVACAction.OFF
-
-        if room.heating_power > 0:
-            return HVACAction.HEATING
-
-        return HVACAction.IDLE
-
-    @property
-    def preset_mode(self) -> str | None:
-        """Return the current preset mode."""
-        room = self._room
-        if not room:
-            return None
-
-        # Check presence state
-        presence = self.coordinator.data.presence
-        presence_locked = self.coordinator.data.presence_locked
-
-        if presence_locked:
+            self._attr_hvac_action = HVACAction.OFF
+        elif room.heating_power > 0:
+            self._attr_hvac_action = HVACAction.HEATING
+        else:
+            self._attr_hvac_action = HVACAction.IDLE
+
+        # Preset mode - check presence state first, then the schedule
+        data = self.coordinator.data
+        presence = data.presence
+        preset_mode: str | None = None
+        if data.presence_locked:
             if presence == "HOME":
-                return PRESET_HOME
-            if presence == "AWAY":
-                return PRESET_AWAY
+                preset_mode = PRESET_HOME
+            elif presence == "AWAY":
+                preset_mode = PRESET_AWAY
         elif presence is not None:
             # Geofencing is active (AUTO mode)
-            return PRESET_AUTO
-
-        # Check schedule
-        if not room.manual_control_active:
-            return PRESET_SCHEDULE
-
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        room = self._room
-        if not room:
-            return {}
+            preset_mode = PRESET_AUTO
+        if preset_mode is None and not room.manual_control_active:
+            preset_mode = PRESET_SCHEDULE
+        self._attr_preset_mode = preset_mode
 
+        # Extra state attributes
         attrs: dict[str, Any] = {
             "heating_power": room.heating_power,
             "manual_control_active": room.manual_control_active,
@@ -226,7 +202,74 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
         if room.open_window_detected:
             attrs["open_window_detected"] = True
 
-        return attrs
+        self._attr_extra_state_attributes = attrs
+
+    async def _async_apply_room_update(self, **changes: Any) -> None:
+        """Apply the expected result of an action to the room and push it.
+
+        New data and room objects are built rather than edited in place, so
+        the previous data is left untouched and entities that compare
+        against it see the change. A refresh is then requested to confirm
+        the real state: async_set_updated_data pushes the next poll a full
+        interval away (45 minutes on the free tier), and the refresh
+        debouncer delays and merges these requests.
+        """
+        data = self.coordinator.data
+        room = data.rooms.get(self._room_id)
+        if room is not None:
+            self.coordinator.async_set_updated_data(
+                replace(
+                    data, rooms={**data.rooms, self._room_id: replace(room, **changes)}
+                )
+            )
+        await self.coordinator.async_request_refresh()
+
+    async def _async_apply_manual_heat(self, temperature: float) -> None:
+        """Apply an indefinite manual heating setting to the room."""
+        await self._async_apply_room_update(
+            power="ON",
+            target_temperature=temperature,
+            manual_control_active=True,
+            manual_control_type=TERMINATION_MANUAL,
+            manual_control_remaining_seconds=None,
+        )
+
+    async def _async_apply_manual_off(self) -> None:
+        """Apply an indefinite manual off setting to the room."""
+        await self._async_apply_room_update(
+            power="OFF",
+            manual_control_active=True,
+            manual_control_type=TERMINATION_MANUAL,
+            manual_control_remaining_seconds=None,
+        )
+
+    async def _async_apply_schedule(self) -> None:
+        """Mark the room as following its schedule again."""
+        await self._async_apply_room_update(
+            boost_mode=False,
+            manual_control_active=False,
+            manual_control_type=None,
+            manual_control_remaining_seconds=None,
+        )
+
+    async def _async_apply_presence(self, presence: str | None, locked: bool) -> None:
+        """Apply a home presence change, push it and confirm it."""
+        data = self.coordinator.data
+        self.coordinator.async_set_updated_data(
+            replace(
+                data,
+                presence=data.presence if presence is None else presence,
+                presence_locked=locked,
+            )
+        )
+        await self.coordinator.async_request_refresh()
+
+    def _target_temperature_or_default(self) -> float:
+        """Return the room's current target temperature, or 21°C if unknown."""
+        room = self._room
+        if room and room.target_temperature is not None:
+            return room.target_temperature
+        return 21.0
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode."""
@@ -239,19 +282,19 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
                 self._room_id,
                 termination_type=TERMINATION_MANUAL,
             )
+            await self._async_apply_manual_off()
         elif hvac_mode == HVACMode.HEAT:
-            # Set to current target or default 21
-            temp = room.target_temperature or 21.0
+            temp = self._target_temperature_or_default()
             await self.coordinator.api.set_room_temperature(
                 self._room_id,
                 temperature=temp,
                 termination_type=TERMINATION_MANUAL,
             )
+            await self._async_apply_manual_heat(temp)
         elif hvac_mode == HVACMode.AUTO:
             # Resume schedule
             await self.coordinator.api.resume_schedule(self._room_id)
-
-        await self.coordinator.async_request_refresh()
+            await self._async_apply_schedule()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set the target temperature."""
@@ -263,40 +306,70 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
         termination_type = kwargs.get("termination_type", defaults.termination_type)
         duration_minutes = kwargs.get("duration", defaults.duration_minutes)
 
-        await self.coordinator.api.set_room_temperature(
-            self._room_id,
-            temperature=temperature,
-            termination_type=termination_type,
-            duration_seconds=duration_minutes * 60,
-        )
-        await self.coordinator.async_request_refresh()
+        # Coalesce rapid changes (e.g. dragging the slider): while a request is
+        # in flight only the latest setting is kept, and sent once it finishes
+        self._pending_temperature = (temperature, termination_type, duration_minutes)
+        if self._set_temperature_lock.locked():
+            return
+
+        async with self._set_temperature_lock:
+            # A failed write doesn't drop settings queued behind it (their
+            # callers already returned); the error is raised if the last
+            # write sent failed
+            error: Exception | None = None
+            while self._pending_temperature is not None:
+                temperature, termination_type, duration_minutes = self._pending_temperature
+                self._pending_temperature = None
+                try:
+                    await self.coordinator.api.set_room_temperature(
+                        self._room_id,
+                        temperature=temperature,
+                        termination_type=termination_type,
+                        duration_seconds=duration_minutes * 60,
+                    )
+                except Exception as err:
+                    error = err
+                    continue
+                error = None
+                await self._async_apply_room_update(
+                    power="ON",
+                    target_temperature=temperature,
+                    manual_control_active=True,
+                    manual_control_type=termination_type,
+                    manual_control_remaining_seconds=(
+                        duration_minutes * 60
+                        if termination_type == TERMINATION_TIMER
+                        else None
+                    ),
+                )
+            if error is not None:
+                raise error
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
         if preset_mode == PRESET_SCHEDULE:
             await self.coordinator.api.resume_schedule(self._room_id)
+            await self._async_apply_schedule()
         elif preset_mode == PRESET_HOME:
             await self.coordinator.api.set_presence_home()
+            await self._async_apply_presence("HOME", locked=True)
         elif preset_mode == PRESET_AWAY:
             await self.coordinator.api.set_presence_away()
+            await self._async_apply_presence("AWAY", locked=True)
         elif preset_mode == PRESET_AUTO:
             await self.coordinator.api.set_presence_auto()
-
-        await self.coordinator.async_request_refresh()
+            # Geofencing decides the presence again; keep the last known one
+            await self._async_apply_presence(None, locked=False)
 
     async def async_turn_on(self) -> None:
         """Turn on heating."""
-        room = self._room
-        temp = room.target_temperature if room else 21.0
-        if temp is None:
-            temp = 21.0
-
+        temp = self._target_temperature_or_default()
         await self.coordinator.api.set_room_temperature(
             self._room_id,
             temperature=temp,
             termination_type=TERMINATION_MANUAL,
         )
-        await self.coordinator.async_request_refresh()
+        await self._async_apply_manual_heat(temp)
 
     async def async_turn_off(self) -> None:
         """Turn off heating."""
@@ -304,9 +377,16 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
             self._room_id,
             termination_type=TERMINATION_MANUAL,
         )
-        await self.coordinator.async_request_refresh()
+        await self._async_apply_manual_off()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._room = self.coordinator.data.rooms.get(self._room_id)
+        # Rooms are compared by value; the home presence feeds preset_mode
+        state_source = self._state_source()
+        if state_source == self._last_state_source:
+            return
+        self._last_state_source = state_source
+        self._update_state_attrs()
         self.async_write_ha_state()
@@ -33,7 +33,40 @@ DEFAULT_SCAN_INTERVAL: Final = 30  # seconds (legacy, use tier-specific)
 # API Rate Limits
 API_QUOTA_FREE_TIER: Final = 100  # requests per day without Auto-Assist
 API_QUOTA_PREMIUM: Final = 20000  # requests per day with Auto-Assist
-API_CALLS_PER_UPDATE: Final = 6  # get_rooms + get_rooms_and_devices + get_home_state + get_weather + get_mobile_devices + get_running_times
+
+# Refresh the access token this many seconds before it expires, with a
+# per-instance jitter so multiple clients don't hit the token endpoint together
+TOKEN_REFRESH_MARGIN: Final = 60
+TOKEN_REFRESH_JITTER: Final = 15
+
+# Minimum delay between persisting API call statistics (in seconds)
+API_STATS_SAVE_DELAY: Final = 300
+
+# Maximum number of concurrent requests when fetching endpoints in parallel
+API_MAX_CONCURRENT_REQUESTS: Final = 4
+
+# Requests held back by the quota gate wait at most this long (in seconds)
+# before failing fast with a rate limit error
+API_THROTTLE_MAX_SLEEP: Final = 10
+
+# After a 429 without a known quota window (ratelimit-policy w=), requests are
+# held back for at most this many seconds rather than until the daily reset
+API_RATE_LIMIT_DEFAULT_HOLD: Final = 300
+
+# Optional endpoints fetched alongside the required ones give up after this
+# many seconds, so a hanging endpoint cannot stall the whole update
+API_OPTIONAL_ENDPOINT_TIMEOUT: Final = 8
+
+# Refresh requests made by entity actions within this many seconds are
+# coalesced into a single refresh
+REQUEST_REFRESH_COOLDOWN: Final = 2.0
+
+# Optional endpoints that keep failing are skipped for an exponentially
+# growing delay, starting at one update interval and capped at this many seconds
+OPTIONAL_ENDPOINT_MAX_BACKOFF: Final = 3600
+
+# Weather data is reused for this many seconds before it is fetched again
+WEATHER_CACHE_TTL: Final = 300
 
 # Config keys for options
 CONF_SCAN_INTERVAL: Final = "scan_interval"
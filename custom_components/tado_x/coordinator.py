@@ -2,21 +2,30 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import random
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import TadoXApi, TadoXApiError, TadoXAuthError, TadoXRateLimitError
 from .const import (
+    API_CALLS_BASE,
     DEFAULT_TIMER_DURATION_MINUTES,
     DOMAIN,
+    OPTIONAL_ENDPOINT_MAX_BACKOFF,
+    REQUEST_REFRESH_COOLDOWN,
     SCAN_INTERVAL_AUTO_ASSIST,
     SCAN_INTERVAL_FREE_TIER,
     TERMINATION_TIMER,
+    WEATHER_CACHE_TTL,
 )
 
 if TYPE_CHECKING:
@@ -24,8 +33,17 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keys of the optional endpoints in the state bundle
+_OPTIONAL_ENDPOINTS = (
+    "weather",
+    "mobile_devices",
+    "air_comfort",
+    "running_times",
+    "flow_temp",
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class TadoXDevice:
     """Representation of a Tado X device."""
 
@@ -42,7 +60,7 @@ class TadoXDevice:
     room_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoXRoom:
     """Representation of a Tado X room."""
 
@@ -66,7 +84,7 @@ class TadoXRoom:
     running_time_today_seconds: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoXRoomControlDefaults:
     """Default control settings for a room."""
 
@@ -74,7 +92,7 @@ class TadoXRoomControlDefaults:
     duration_minutes: int = DEFAULT_TIMER_DURATION_MINUTES
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoXWeather:
     """Representation of Tado weather data."""
 
@@ -83,7 +101,7 @@ class TadoXWeather:
     weather_state: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoXMobileDevice:
     """Representation of a Tado mobile device for geofencing."""
 
@@ -95,7 +113,7 @@ class TadoXMobileDevice:
     geofencing_enabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoXRoomAirComfort:
     """Air comfort data for a room."""
 
@@ -104,7 +122,7 @@ class TadoXRoomAirComfort:
     comfort_level: str | None = None  # Based on temperature/humidity
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoXData:
     """Data from Tado X API."""
 
@@ -115,12 +133,16 @@ class TadoXData:
     other_devices: list[TadoXDevice] = field(default_factory=list)
     presence: str | None = None  # HOME, AWAY, or None if not locked
     presence_locked: bool = False  # Whether presence is manually set
-    api_calls_today: int = 0
-    api_reset_time: datetime | None = None
+    # API usage counters change on every poll, so they are left out of the
+    # equality check (see async_add_api_stats_listener)
+    api_calls_today: int = field(default=0, compare=False)
+    api_reset_time: datetime | None = field(default=None, compare=False)
     has_auto_assist: bool = False
     # Real values from Tado API response headers
-    api_quota_limit: int | None = None  # From ratelimit-policy header (q=)
-    api_quota_remaining: int | None = None  # From ratelimit header (r=)
+    # From ratelimit-policy header (q=)
+    api_quota_limit: int | None = field(default=None, compare=False)
+    # From ratelimit header (r=)
+    api_quota_remaining: int | None = field(default=None, compare=False)
     # Weather data
     weather: TadoXWeather | None = None
     # Mobile devices for geofencing
@@ -141,6 +163,22 @@ class TadoXData:
     has_flow_temp_control: bool = False
 
 
+# Shared fallback for missing or null nested objects; never mutated
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _get_dict(parent: Mapping[str, Any], key: str) -> Mapping[str, Any]:
+    """Return the nested object at key, or an empty mapping if missing or null."""
+    return parent.get(key) or _EMPTY
+
+
+def _unwrap(result: Any) -> Any:
+    """Return a gathered API result, re-raising it if the call failed."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
     """Class to manage fetching Tado X data."""
 
@@ -171,14 +209,27 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # TadoXData compares by value without the API usage counters, so
+            # unchanged polls skip entity writes
+            always_update=False,
+            # Rapid entity actions (e.g. repeated button presses) share one refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.api = api
         self.home_id = home_id
+        # String form used to build unique IDs and device identifiers
+        self.home_id_str = str(home_id)
+        # Shared via_device link from room and bridge devices to the home device
+        self.home_via_device = (DOMAIN, self.home_id_str)
         self.home_name = home_name
         self.api.home_id = home_id
         self._save_api_stats_callback = save_api_stats_callback
         self._scan_interval = scan_interval
         self.room_control_defaults: dict[int, TadoXRoomControlDefaults] = {}
+        # Climate entity unique_id -> room_id, filled by the set_climate_timer service
+        self.room_id_for_unique_id: dict[str, int] = {}
 
         # Feature toggles for optional API calls
         self.enable_weather = enable_weather
@@ -187,6 +238,14 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
         self.enable_running_times = enable_running_times
         self.enable_flow_temp = enable_flow_temp
 
+        # Called with the new data when only the API usage counters changed
+        self._api_stats_listeners: list[Callable[[TadoXData], None]] = []
+
+        # Optional endpoint key -> (monotonic time of next attempt, current delay)
+        self._endpoint_backoff: dict[str, tuple[float, float]] = {}
+        # Last weather reading and the monotonic time it was fetched
+        self._weather_cache: tuple[float, TadoXWeather] | None = None
+
         _LOGGER.info(
             "Tado X coordinator initialized with %d second update interval (%s tier)",
             scan_interval,
@@ -203,19 +262,99 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
         self.update_interval = timedelta(seconds=new_interval)
         _LOGGER.info("Scan interval updated to %d seconds", new_interval)
 
+    @callback
+    def async_add_api_stats_listener(
+        self, update_callback: Callable[[TadoXData], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for API usage counter changes on otherwise unchanged polls.
+
+        The counters don't take part in TadoXData equality, so a poll that
+        only moved them does not notify the coordinator listeners. Returns a
+        callable that removes the listener.
+        """
+        self._api_stats_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._api_stats_listeners.remove(update_callback)
+
+        return remove_listener
+
     def get_api_calls_per_update(self) -> int:
         """Calculate the number of API calls per update based on enabled features."""
         # Base calls: get_rooms, get_rooms_and_devices, get_home_state
-        calls = 3
-        if self.enable_weather:
-            calls += 1
-        if self.enable_mobile_devices:
-            calls += 1
-        if self.enable_air_comfort:
-            calls += 1
-        if self.enable_running_times:
-            calls += 1
-        return calls
+        # plus the optional endpoints that are enabled and not backing off
+        return API_CALLS_BASE + sum(self._optional_endpoints().values())
+
+    def _optional_endpoints(self) -> dict[str, bool]:
+        """Return which optional endpoints should be fetched on this update."""
+        now = time.monotonic()
+        return {
+            key: enabled
+            and now >= self._endpoint_backoff.get(key, (0.0, 0.0))[0]
+            for key, enabled in zip(
+                _OPTIONAL_ENDPOINTS,
+                (
+                    self.enable_weather and self._cached_weather(now) is None,
+                    self.enable_mobile_devices,
+                    self.enable_air_comfort,
+                    self.enable_running_times,
+                    self.enable_flow_temp,
+                ),
+            )
+        }
+
+    def _cached_weather(self, now: float) -> TadoXWeather | None:
+        """Return the cached weather if it is younger than WEATHER_CACHE_TTL."""
+        if self._weather_cache is None:
+            return None
+        fetched_at, weather = self._weather_cache
+        return weather if now - fetched_at < WEATHER_CACHE_TTL else None
+
+    def _record_endpoint_result(self, key: str, failed: bool) -> None:
+        """Reset or grow the backoff of an optional endpoint after a call."""
+        if not failed:
+            self._endpoint_backoff.pop(key, None)
+            return
+        _, prev_delay = self._endpoint_backoff.get(key, (0.0, 0.0))
+        delay = min(
+            prev_delay * 2 if prev_delay else self._scan_interval,
+            OPTIONAL_ENDPOINT_MAX_BACKOFF,
+        )
+        next_try = time.monotonic() + delay * random.uniform(0.5, 1.5)
+        self._endpoint_backoff[key] = (next_try, delay)
+        _LOGGER.debug("Skipping %s endpoint for about %d seconds", key, delay)
+
+    def _defer_optional_endpoints(self, reset_time: datetime | None) -> None:
+        """Hold back all optional endpoints until the API quota resets."""
+        if reset_time is None:
+            return
+        next_try = time.monotonic() + max(reset_time.timestamp() - time.time(), 0.0)
+        for key in _OPTIONAL_ENDPOINTS:
+            _, delay = self._endpoint_backoff.get(key, (0.0, 0.0))
+            self._endpoint_backoff[key] = (next_try, delay)
+
+    def build_device_numbering(self) -> dict[str, tuple[int, int]]:
+        """Number devices of the same type within each room.
+
+        Returns a map of serial number to (ordinal, count), where ordinal is
+        the 1-based position of the device among the devices of its type in
+        its room (sorted by serial number). Devices without a room are left out.
+        """
+        groups: dict[tuple[int, str], list[str]] = {}
+        for device in self.data.devices.values():
+            if device.room_id:
+                groups.setdefault((device.room_id, device.device_type), []).append(
+                    device.serial_number
+                )
+
+        numbering: dict[str, tuple[int, int]] = {}
+        for serials in groups.values():
+            serials.sort()
+            count = len(serials)
+            for ordinal, serial in enumerate(serials, start=1):
+                numbering[serial] = (ordinal, count)
+        return numbering
 
     def get_room_control_defaults(self, room_id: int) -> TadoXRoomControlDefaults:
         """Return per-room control defaults, creating them if missing."""
@@ -242,35 +381,60 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
     async def _async_update_data(self) -> TadoXData:
         """Fetch data from Tado X API."""
         try:
-            # Get rooms with current state (required)
-            rooms_data = await self.api.get_rooms()
+            # Fetch all endpoints concurrently; each entry is a result or the
+            # exception its call raised
+            wanted = self._optional_endpoints()
+            results = await self.api.get_state_bundle(
+                want_weather=wanted["weather"],
+                want_mobile_devices=wanted["mobile_devices"],
+                want_air_comfort=wanted["air_comfort"],
+                running_times_date=(
+                    date.today().isoformat() if wanted["running_times"] else None
+                ),
+                want_flow_temp=wanted["flow_temp"],
+            )
 
-            # Get rooms with devices (required)
-            rooms_devices_data = await self.api.get_rooms_and_devices()
+            # Auth and rate limit errors are fatal even from optional endpoints
+            for result in results.values():
+                if isinstance(result, (TadoXAuthError, TadoXRateLimitError)):
+                    raise result
 
-            # Get home presence state (required)
-            home_state = await self.api.get_home_state()
+            # Rooms, rooms with devices and home presence state are required
+            rooms_data = _unwrap(results["rooms"])
+            rooms_devices_data = _unwrap(results["rooms_and_devices"])
+            home_state = _unwrap(results["home_state"])
             presence = home_state.get("presence")
             presence_locked = home_state.get("presenceLocked", False)
 
-            # Get weather data (optional)
-            weather = None
-            if self.enable_weather:
-                weather_data = await self.api.get_weather()
-                outdoor_temp_data = weather_data.get("outsideTemperature") or {}
-                solar_data = weather_data.get("solarIntensity") or {}
-                weather_state_data = weather_data.get("weatherState") or {}
+            # Back off optional endpoints that failed, reset those that worked
+            for key in _OPTIONAL_ENDPOINTS:
+                if key in results:
+                    self._record_endpoint_result(
+                        key, isinstance(results[key], BaseException)
+                    )
+
+            # Weather data (optional)
+            weather = self._cached_weather(time.monotonic())
+            weather_data = results.get("weather")
+            if isinstance(weather_data, BaseException):
+                _LOGGER.warning("Failed to fetch weather data: %s", weather_data)
+            elif weather_data is not None:
+                outdoor_temp_data = _get_dict(weather_data, "outsideTemperature")
+                solar_data = _get_dict(weather_data, "solarIntensity")
+                weather_state_data = _get_dict(weather_data, "weatherState")
 
                 weather = TadoXWeather(
                     outdoor_temperature=outdoor_temp_data.get("celsius"),
                     solar_intensity=solar_data.get("percentage"),
                     weather_state=weather_state_data.get("value"),
                 )
+                self._weather_cache = (time.monotonic(), weather)
 
-            # Get mobile devices for geofencing (optional)
-            mobile_devices_data = []
-            if self.enable_mobile_devices:
-                mobile_devices_data = await self.api.get_mobile_devices()
+            # Mobile devices for geofencing (optional)
+            mobile_devices_data = results.get("mobile_devices") or []
+            if isinstance(mobile_devices_data, BaseException):
+                _LOGGER.warning("Failed to fetch mobile devices: %s", mobile_devices_data)
+                mobile_devices_data = []
 
             # Process the data
             data = TadoXData(
@@ -280,60 +444,60 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                 presence_locked=presence_locked,
                 weather=weather,
             )
+            # Local aliases for the dicts filled in the loops below
+            rooms = data.rooms
+            devices = data.devices
 
             # Process rooms and devices
-            rooms_info = rooms_devices_data.get("rooms", [])
-            room_devices_map: dict[int, list[dict]] = {}
-
-            for room_info in rooms_info:
-                room_id = room_info.get("roomId")
-                if room_id:
-                    room_devices_map[room_id] = room_info.get("devices", [])
-
-            # Process room states
+            room_devices_map: dict[int, list[dict]] = {
+                room_info["roomId"]: room_info.get("devices") or []
+                for room_info in rooms_devices_data.get("rooms") or []
+                if room_info.get("roomId")
+            }
+
+            # Process room states, tracking the room with the most devices
+            # (used to associate the thermostat controller below)
+            room_with_most_devices: int | None = None
+            max_device_count = 0
+            # Checked once so the per-room debug logging costs nothing when off
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
             for room_data in rooms_data:
                 room_id = room_data.get("id")
                 if not room_id:
                     continue
 
                 # Debug: log raw room data for power/setting analysis
-                setting = room_data.get("setting") or {}
-                _LOGGER.debug(
-                    "Room %s (%s) - setting: %s, manualControl: %s",
-                    room_id,
-                    room_data.get("name"),
-                    setting,
-                    room_data.get("manualControlTermination"),
-                )
+                setting = _get_dict(room_data, "setting")
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Room %s (%s) - setting: %s, manualControl: %s",
+                        room_id,
+                        room_data.get("name"),
+                        setting,
+                        room_data.get("manualControlTermination"),
+                    )
 
-                # Get sensor data (use 'or {}' to handle None values)
-                sensor_data = room_data.get("sensorDataPoints") or {}
-                inside_temp = sensor_data.get("insideTemperature") or {}
-                humidity_data = sensor_data.get("humidity") or {}
+                # Get sensor data
+                sensor_data = _get_dict(room_data, "sensorDataPoints")
+                inside_temp = _get_dict(sensor_data, "insideTemperature")
+                humidity_data = _get_dict(sensor_data, "humidity")
 
-                # Get setting (use 'or {}' to handle None values)
-                setting = room_data.get("setting") or {}
-                target_temp = setting.get("temperature") or {}
+                # Get target temperature from the setting
+                target_temp = _get_dict(setting, "temperature")
 
                 # Get manual control info
                 manual_control = room_data.get("manualControlTermination")
-                manual_active = manual_control is not None
-                manual_remaining = None
-                manual_type = None
-                if manual_control:
-                    manual_remaining = manual_control.get("remainingTimeInSeconds")
-                    manual_type = manual_control.get("type")
-
-                # Get next schedule change (use 'or {}' to handle None values)
-                next_change = room_data.get("nextScheduleChange") or {}
-                next_change_time = next_change.get("start")
-                next_change_setting = next_change.get("setting") or {}
-                next_change_temp_obj = next_change_setting.get("temperature") or {}
-                next_change_temp = next_change_temp_obj.get("value")
-
-                # Get heating power and connection (use 'or {}' to handle None values)
-                heating_power_data = room_data.get("heatingPower") or {}
-                connection_data = room_data.get("connection") or {}
+                manual_details = manual_control or _EMPTY
+
+                # Get next schedule change
+                next_change = _get_dict(room_data, "nextScheduleChange")
+                next_change_temp = _get_dict(
+                    _get_dict(next_change, "setting"), "temperature"
+                ).get("value")
+
+                # Get heating power and connection
+                heating_power_data = _get_dict(room_data, "heatingPower")
+                connection_data = _get_dict(room_data, "connection")
 
                 room = TadoXRoom(
                     room_id=room_id,
@@ -344,18 +508,20 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     heating_power=heating_power_data.get("percentage", 0),
                     power=setting.get("power", "OFF"),
                     connection_state=connection_data.get("state", "DISCONNECTED"),
-                    manual_control_active=manual_active,
-                    manual_control_remaining_seconds=manual_remaining,
-                    manual_control_type=manual_type,
+                    manual_control_active=manual_control is not None,
+                    manual_control_remaining_seconds=manual_details.get(
+                        "remainingTimeInSeconds"
+                    ),
+                    manual_control_type=manual_details.get("type"),
                     boost_mode=room_data.get("boostMode") is not None,
                     open_window_detected=room_data.get("openWindow") is not None,
-                    next_schedule_change=next_change_time,
+                    next_schedule_change=next_change.get("start"),
                     next_schedule_temperature=next_change_temp,
                 )
 
                 # Add devices for this room
-                for device_data in room_devices_map.get(room_id, []):
-                    device_connection = device_data.get("connection") or {}
+                for device_data in room_devices_map.get(room_id, ()):
+                    device_connection = _get_dict(device_data, "connection")
                     device = TadoXDevice(
                         serial_number=device_data.get("serialNumber", ""),
                         device_type=device_data.get("type", ""),
@@ -370,34 +536,29 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                         room_name=room.name,
                     )
                     room.devices.append(device)
-                    data.devices[device.serial_number] = device
-
-                data.rooms[room_id] = room
+                    devices[device.serial_number] = device
 
-            # Process other devices (bridge, thermostat controller)
-            # First, find the room with the most devices (for thermostat association)
-            room_with_most_devices: int | None = None
-            max_device_count = 0
-            for room_id, room in data.rooms.items():
-                device_count = len(room.devices)
-                if device_count > max_device_count:
-                    max_device_count = device_count
+                if len(room.devices) > max_device_count:
+                    max_device_count = len(room.devices)
                     room_with_most_devices = room_id
 
+                rooms[room_id] = room
+
+            # Process other devices (bridge, thermostat controller)
             for device_data in rooms_devices_data.get("otherDevices") or []:
-                other_device_connection = device_data.get("connection") or {}
+                other_device_connection = _get_dict(device_data, "connection")
                 other_room_id = device_data.get("roomId")
                 other_room_name = None
                 device_type = device_data.get("type", "")
 
                 # If device has a room association from API, use it
-                if other_room_id and other_room_id in data.rooms:
-                    other_room_name = data.rooms[other_room_id].name
+                if other_room_id and other_room_id in rooms:
+                    other_room_name = rooms[other_room_id].name
                 # For Wireless Receiver X (TR04) without room, associate with the room
                 # that has the most devices (typically the main room it controls)
                 elif device_type == "TR04" and room_with_most_devices:
                     other_room_id = room_with_most_devices
-                    other_room_name = data.rooms[room_with_most_devices].name
+                    other_room_name = rooms[room_with_most_devices].name
                     _LOGGER.debug(
                         "Associating Wireless Receiver X %s with room %s (%s) - room has %d devices",
                         device_data.get("serialNumber"),
@@ -416,11 +577,11 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                 )
 
                 # If device has a room, add it to the room's device list
-                if other_room_id and other_room_id in data.rooms:
-                    data.rooms[other_room_id].devices.append(device)
+                if other_room_id and other_room_id in rooms:
+                    rooms[other_room_id].devices.append(device)
 
                 data.other_devices.append(device)
-                data.devices[device.serial_number] = device
+                devices[device.serial_number] = device
 
             # Process mobile devices
             for mobile_data in mobile_devices_data:
@@ -429,8 +590,8 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     continue
 
                 # Get location info
-                location_data = mobile_data.get("location") or {}
-                settings_data = mobile_data.get("settings") or {}
+                location_data = _get_dict(mobile_data, "location")
+                settings_data = _get_dict(mobile_data, "settings")
                 geo_tracking = settings_data.get("geoTrackingEnabled", False)
 
                 # Determine if at home based on location
@@ -447,11 +608,10 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                 )
                 data.mobile_devices[device_id] = mobile_device
 
-            # Fetch running times data for today (optional)
-            if self.enable_running_times:
+            # Running times data for today (optional)
+            if "running_times" in results:
                 try:
-                    today = date.today().isoformat()
-                    running_times_data = await self.api.get_running_times(today, today)
+                    running_times_data = _unwrap(results["running_times"])
                     data.running_times = running_times_data
 
                     # Process running times per zone/room
@@ -462,8 +622,8 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                         for zone_data in zones:
                             zone_id = zone_data.get("id")
                             zone_running_seconds = zone_data.get("runningTimeInSeconds", 0)
-                            if zone_id and zone_id in data.rooms:
-                                data.rooms[zone_id].running_time_today_seconds = zone_running_seconds
+                            if zone_id and zone_id in rooms:
+                                rooms[zone_id].running_time_today_seconds = zone_running_seconds
 
                     _LOGGER.debug("Running times fetched: %s zones", len(running_times_list))
                 except Exception as err:
@@ -472,10 +632,10 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     _LOGGER.warning("Failed to fetch running times data: %s", err)
                     data.running_times = {}
 
-            # Fetch air comfort data (optional)
-            if self.enable_air_comfort:
+            # Air comfort data (optional)
+            if "air_comfort" in results:
                 try:
-                    air_comfort_data = await self.api.get_air_comfort()
+                    air_comfort_data = _unwrap(results["air_comfort"])
                     comfort_list = air_comfort_data.get("comfort", [])
                     for comfort_entry in comfort_list:
                         room_id = comfort_entry.get("roomId")
@@ -500,17 +660,17 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     # Air comfort endpoint might not be available for all accounts
                     _LOGGER.warning("Failed to fetch air comfort data: %s", err)
 
-            # Fetch flow temperature optimization settings (if available and enabled)
-            if self.enable_flow_temp:
+            # Flow temperature optimization settings (if available and enabled)
+            if "flow_temp" in results:
                 try:
-                    flow_data = await self.api.get_flow_temperature_optimization()
+                    flow_data = _unwrap(results["flow_temp"])
                     if flow_data:
                         data.has_flow_temp_control = True
                         data.max_flow_temperature = flow_data.get("maxFlowTemperature")
-                        constraints = flow_data.get("maxFlowTemperatureConstraints", {})
+                        constraints = _get_dict(flow_data, "maxFlowTemperatureConstraints")
                         data.flow_temp_min = constraints.get("min")
                         data.flow_temp_max = constraints.get("max")
-                        auto_adapt = flow_data.get("autoAdaptation", {})
+                        auto_adapt = _get_dict(flow_data, "autoAdaptation")
                         data.flow_temp_auto_adaptation = auto_adapt.get("enabled", False)
                         data.flow_temp_auto_value = auto_adapt.get("maxFlowTemperature")
                         _LOGGER.debug(
@@ -533,6 +693,12 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
             data.api_quota_limit = self.api.api_quota_limit
             data.api_quota_remaining = self.api.api_quota_remaining
 
+            # An unchanged poll skips the coordinator listeners (always_update
+            # is off), so push the new counters to the API sensors directly
+            if data == self.data:
+                for update_callback in list(self._api_stats_listeners):
+                    update_callback(data)
+
             # Save API stats for persistence
             if self._save_api_stats_callback:
                 self._save_api_stats_callback()
@@ -545,11 +711,14 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                 "Rate limit hit. Suspending API calls until %s. Using cached data.",
                 err.reset_time,
             )
+            # Let the required endpoints go first once the quota resets
+            self._defer_optional_endpoints(err.reset_time)
             if self.data:
-                # Return previous data with rate_limited flag set
-                self.data.rate_limited = True
-                self.data.rate_limit_reset = err.reset_time
-                return self.data
+                # Return a copy of the previous data with rate_limited flag set
+                # (mutating it in place would compare equal and skip the update)
+                return replace(
+                    self.data, rate_limited=True, rate_limit_reset=err.reset_time
+                )
             # No previous data - create minimal data with rate limited status
             return TadoXData(
                 home_id=self.home_id,
@@ -378,6 +378,7 @@ class TadoXHomeSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntit
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.data.home_id}_{description.key}"
+        self._attr_native_value = description.value_fn(coordinator.data)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -388,14 +389,25 @@ class TadoXHomeSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntit
             manufacturer="Tado",
         )
 
-    @property
-    def native_value(self) -> Any:
-        """Return the sensor value."""
-        return self.entity_description.value_fn(self.coordinator.data)
+    async def async_added_to_hass(self) -> None:
+        """Also listen for API usage changes on otherwise unchanged polls."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_api_stats_listener(self._handle_api_stats_update)
+        )
+
+    @callback
+    def _handle_api_stats_update(self, data: TadoXData) -> None:
+        """Handle new API usage counters, writing state only if the value moved."""
+        value = self.entity_description.value_fn(data)
+        if value != self._attr_native_value:
+            self._attr_native_value = value
+            self.async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator.data)
         self.async_write_ha_state()
 
 
@@ -0,0 +1 @@
+"""Tests for the Tado X integration."""
@@ -0,0 +1,84 @@
+"""Tests for the Tado X climate entity."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.tado_x.api import TadoXApiError
+from custom_components.tado_x.climate import TadoXClimate
+from custom_components.tado_x.coordinator import TadoXRoomControlDefaults
+
+
+def _make_climate(set_room_temperature: AsyncMock) -> TadoXClimate:
+    """Build a climate entity around a mocked coordinator, skipping setup."""
+    climate = TadoXClimate.__new__(TadoXClimate)
+    climate.coordinator = MagicMock()
+    climate.coordinator.get_room_control_defaults.return_value = (
+        TadoXRoomControlDefaults()
+    )
+    climate.coordinator.api.set_room_temperature = set_room_temperature
+    climate._room_id = 1
+    climate._pending_temperature = None
+    climate._set_temperature_lock = asyncio.Lock()
+    climate._async_apply_room_update = AsyncMock()
+    return climate
+
+
+def test_set_temperature_sends_coalesced_value_after_failed_write() -> None:
+    """A setting queued behind a failing write is still sent."""
+
+    async def run() -> None:
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def set_room_temperature(
+            room_id: int, *, temperature: float, **kwargs: Any
+        ) -> None:
+            if temperature == 20.0:
+                started.set()
+                await release.wait()
+                raise TadoXApiError("Request failed")
+
+        api_call = AsyncMock(side_effect=set_room_temperature)
+        climate = _make_climate(api_call)
+
+        first = asyncio.create_task(climate.async_set_temperature(temperature=20.0))
+        await started.wait()
+        # Coalesced while the first write is in flight: returns immediately
+        await climate.async_set_temperature(temperature=21.0)
+        release.set()
+        # The last write succeeded, so the first caller sees no error
+        await first
+
+        assert [call.kwargs["temperature"] for call in api_call.await_args_list] == [
+            20.0,
+            21.0,
+        ]
+        climate._async_apply_room_update.assert_awaited_once()
+        assert (
+            climate._async_apply_room_update.call_args.kwargs["target_temperature"]
+            == 21.0
+        )
+        assert climate._pending_temperature is None
+
+    asyncio.run(run())
+
+
+def test_set_temperature_raises_when_last_write_fails() -> None:
+    """A failed write with nothing queued behind it reaches the caller."""
+
+    async def run() -> None:
+        api_call = AsyncMock(side_effect=TadoXApiError("Request failed"))
+        climate = _make_climate(api_call)
+
+        with pytest.raises(TadoXApiError):
+            await climate.async_set_temperature(temperature=20.0)
+
+        climate._async_apply_room_update.assert_not_awaited()
+        assert climate._pending_temperature is None
+        assert not climate._set_temperature_lock.locked()
+
+    asyncio.run(run())